@@ -1,9 +1,9 @@
 """Module providing the DataInlet class for MoBI_View.
 
-The DataInlet class is responsible for acquiring and buffering data from LSL streams.
+The DataInlet class is responsible for acquiring data from LSL streams.
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from pylsl.info import StreamInfo
@@ -13,6 +13,14 @@ from PyQt6 import QtCore
 
 from MoBI_View.core import config, exceptions
 
+_CHANNEL_FORMAT_DTYPES: Dict[int, type] = {
+    1: np.float32,
+    2: np.float64,
+    4: np.int32,
+    5: np.int16,
+    6: np.int8,
+}
+
 
 class DataInlet(QtCore.QObject):
     """Handles data acquisition from LSL streams.
@@ -22,17 +30,18 @@ class DataInlet(QtCore.QObject):
         stream_name: The name of the LSL stream.
         stream_type: The content type of the LSL stream (e.g., EEG, Gaze).
         channel_info: Information about channels, including labels, types, and units.
+        channel_labels: The channel labels from channel_info, as an immutable tuple.
         channel_count: The number of channels in the LSL stream.
         channel_format: The format (data type) of the channel data.
-        buffers: Buffer to store incoming samples, initialized to zeros.
-        ptr: Pointer to the current index in the buffer.
+        _chunk_buffer: Preallocated array that liblsl writes pulled chunks into,
+            in the stream's native data type.
     """
 
     def __init__(self, partial_info: StreamInfo) -> None:
         """Initializes the DataInlet instance and performs initial validation.
 
-        Sets up the LSL stream inlet, extracts channel information, initializes the
-        buffer for storing incoming data samples, and validates the channel count
+        Sets up the LSL stream inlet, extracts channel information, allocates the
+        array that pulled chunks are written into, and validates the channel count
         and channel format to ensure compatibility.
 
         Args:
@@ -50,24 +59,25 @@ class DataInlet(QtCore.QObject):
         self.stream_name: str = info.name()
         self.stream_type: str = info.type()
         self.channel_info: Dict[str, List[str]] = self.get_channel_information(info)
+        self.channel_labels: Tuple[str, ...] = tuple(self.channel_info["labels"])
         self.channel_count: int = info.channel_count()
         self.channel_format: int = info.channel_format()
-        self.buffers: np.ndarray = np.zeros(
-            (config.Config.BUFFER_SIZE, self.channel_count)
-        )
-        self.ptr: int = 0
 
         if self.channel_count <= 0:
             raise exceptions.InvalidChannelCountError(
                 "Unable to plot data without channels."
             )
 
-        valid_channel_formats = {1, 2, 4, 5, 6}
-        if info.channel_format() not in valid_channel_formats:
+        if self.channel_format not in _CHANNEL_FORMAT_DTYPES:
             raise exceptions.InvalidChannelFormatError(
                 "Unable to plot non-numeric data."
             )
 
+        dtype = _CHANNEL_FORMAT_DTYPES[self.channel_format]
+        self._chunk_buffer: np.ndarray = np.empty(
+            (config.Config.BUFFER_SIZE, self.channel_count), dtype=dtype
+        )
+
     def get_channel_information(self, info: StreamInfo) -> Dict[str, List[str]]:
         """Extracts channel information from the StreamInfo.
 
@@ -82,47 +92,48 @@ class DataInlet(QtCore.QObject):
             A dictionary containing channel information with keys 'labels',
             'types', and 'units'. If metadata is missing, default values are used.
         """
-        channel_labels = info.get_channel_labels() or []
-        channel_types = info.get_channel_types() or []
-        channel_units = info.get_channel_units() or []
-
         channel_count = info.channel_count()
-        channel_info: Dict[str, List[str]] = {"labels": [], "types": [], "units": []}
-
-        channel_info["labels"] = [
-            channel_labels[i]
-            if i < len(channel_labels) and channel_labels[i] is not None
-            else f"Channel {i + 1}"
-            for i in range(channel_count)
-        ]
-        channel_info["types"] = [
-            channel_types[i]
-            if i < len(channel_types) and channel_types[i] is not None
-            else "unknown"
-            for i in range(channel_count)
-        ]
-        channel_info["units"] = [
-            channel_units[i]
-            if i < len(channel_units) and channel_units[i] is not None
-            else "unknown"
-            for i in range(channel_count)
-        ]
+        missing: List[Optional[str]] = [None] * channel_count
+        channel_labels = ((info.get_channel_labels() or []) + missing)[:channel_count]
+        channel_types = ((info.get_channel_types() or []) + missing)[:channel_count]
+        channel_units = ((info.get_channel_units() or []) + missing)[:channel_count]
+
+        channel_info: Dict[str, List[str]] = {
+            "labels": [
+                label if label is not None else f"Channel {i + 1}"
+                for i, label in enumerate(channel_labels)
+            ],
+            "types": [
+                channel_type if channel_type is not None else "unknown"
+                for channel_type in channel_types
+            ],
+            "units": [
+                unit if unit is not None else "unknown" for unit in channel_units
+            ],
+        }
 
         return channel_info
 
-    def pull_sample(self) -> None:
-        """Pulls a data sample from the LSL stream and updates the buffer.
+    def pull_chunk(self) -> np.ndarray:
+        """Pulls all pending samples from the LSL stream.
+
+        Drains up to BUFFER_SIZE samples from the LSL stream inlet in a single call,
+        letting liblsl write them directly into a preallocated array. If the stream
+        is lost during the operation, a StreamLostError is raised.
 
-        Retrieves a sample from the LSL stream inlet and stores it in the buffer.
-        If the stream is lost during the operation, a StreamLostError is raised.
+        Returns:
+            A (n_samples, channel_count) view of the samples pulled by this call, in
+            the stream's native data type. The view is overwritten by the next call.
 
         Raises:
             StreamLostError: If the stream source has been lost.
         """
         try:
-            sample, _ = self.inlet.pull_sample(timeout=0.0)
-            if sample:
-                self.buffers[self.ptr % config.Config.BUFFER_SIZE] = sample
-                self.ptr += 1
+            _, timestamps = self.inlet.pull_chunk(
+                timeout=0.0,
+                max_samples=config.Config.BUFFER_SIZE,
+                dest_obj=self._chunk_buffer,
+            )
         except LostError:
             raise exceptions.StreamLostError("Stream source has been lost.")
+        return self._chunk_buffer[: len(timestamps)]
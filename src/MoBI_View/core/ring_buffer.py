@@ -0,0 +1,87 @@
+"""Module providing the RingBuffer class for MoBI_View.
+
+The RingBuffer class keeps the most recent samples of one plotted channel.
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-capacity buffer holding the most recent samples of a channel.
+
+    Every sample is stored twice (at i and i + capacity) so that the buffered samples
+    are always one contiguous slice, oldest first.
+
+    Attributes:
+        capacity: The maximum number of samples kept.
+        dtype: The data type the samples are stored in.
+        _data: Backing array of 2 * capacity samples.
+        _write_index: Position that receives the next sample.
+        _count: Number of buffered samples.
+        _out: Preallocated array that receives the snapshots handed to the plot.
+    """
+
+    def __init__(self, capacity: int, dtype: type = np.float32) -> None:
+        """Initializes an empty ring buffer.
+
+        Args:
+            capacity: The maximum number of samples kept.
+            dtype: The data type the samples are stored in.
+        """
+        self.capacity: int = capacity
+        self.dtype: type = dtype
+        self._data: np.ndarray = np.zeros(2 * capacity, dtype=dtype)
+        self._write_index: int = 0
+        self._count: int = 0
+        self._out: np.ndarray = np.empty(capacity, dtype=dtype)
+
+    def __len__(self) -> int:
+        """Returns the number of buffered samples."""
+        return self._count
+
+    def write(self, values: np.ndarray) -> None:
+        """Copies consecutive samples into the buffer.
+
+        Only the most recent samples that fit in the buffer are kept. Both halves of
+        the backing array are written with at most four slice assignments.
+
+        Args:
+            values: The new samples, oldest first.
+        """
+        capacity = self.capacity
+        data = self._data
+        values = values[-capacity:]
+        n_values = len(values)
+        head = self._write_index
+        first = min(n_values, capacity - head)
+        data[head : head + first] = values[:first]
+        data[head + capacity : head + capacity + first] = values[:first]
+        rest = n_values - first
+        data[:rest] = values[first:]
+        data[capacity : capacity + rest] = values[first:]
+        self._write_index = (head + n_values) % capacity
+        self._count = min(self._count + n_values, capacity)
+
+    def window(self) -> np.ndarray:
+        """Returns the buffered samples, oldest first.
+
+        Returns:
+            A contiguous view into the backing array. No data is copied.
+        """
+        end = self._write_index + self.capacity
+        return self._data[end - self._count : end]
+
+    def snapshot(self) -> np.ndarray:
+        """Copies the buffered samples into the preallocated output array.
+
+        The same output array is reused by every call, so no new array is allocated
+        per redraw. The returned view is overwritten in place by the next call to
+        snapshot() and is only valid until then.
+
+        Returns:
+            A view of the output array holding the buffered samples, oldest first.
+        """
+        window = self.window()
+        out = self._out[: len(window)]
+        np.copyto(out, window)
+        return out
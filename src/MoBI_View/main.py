@@ -1,23 +1,46 @@
 """Module providing the main entry point for the MoBI_View application.
 
-This module discovers all available LSL streams, creates DataInlet objects for each,
-and initializes the MainAppPresenter and MainAppView. It then launches the PyQt6
-application event loop.
+This module discovers all available LSL streams, creates DataInlet objects for each
+(opening the inlets concurrently), and initializes the MainAppPresenter and
+MainAppView. It then launches the PyQt6 application event loop.
 
 Usage:
     python -m src.MoBI_View.main
 """
 
 import sys
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, cast
 
-from pylsl import resolve_streams
+from pylsl import StreamInfo, resolve_streams
+from PyQt6.QtCore import QThread
 from PyQt6.QtWidgets import QApplication
 
 from MoBI_View.core.data_inlet import DataInlet
 from MoBI_View.presenters.main_app_presenter import MainAppPresenter
 from MoBI_View.views.main_app_view import MainAppView
 
+_MAX_INLET_WORKERS = 32
+
+
+def _create_inlet(info: StreamInfo, owner_thread: QThread) -> DataInlet:
+    """Opens a DataInlet for a stream and hands it over to the owner thread.
+
+    Opening an inlet blocks on liblsl while the full stream metadata is fetched, so
+    this runs on a worker thread. The new DataInlet is moved to the thread that
+    owns the application objects before it is returned.
+
+    Args:
+        info: The partial StreamInfo from resolve_streams().
+        owner_thread: The thread the DataInlet should belong to.
+
+    Returns:
+        The initialized DataInlet.
+    """
+    inlet = DataInlet(info)
+    inlet.moveToThread(owner_thread)
+    return inlet
+
 
 def main() -> None:
     """Launches the MoBI_View application."""
@@ -28,9 +51,17 @@ def main() -> None:
     data_inlets: List[DataInlet] = []
     stream_info_map: dict[str, str] = {}
 
-    for info in discovered_streams:
+    main_thread = cast(QThread, QThread.currentThread())
+    workers = max(1, min(_MAX_INLET_WORKERS, len(discovered_streams)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_create_inlet, info, main_thread)
+            for info in discovered_streams
+        ]
+
+    for info, future in zip(discovered_streams, futures):
         try:
-            inlet = DataInlet(info)
+            inlet = future.result()
             data_inlets.append(inlet)
             stream_info_map[inlet.stream_name] = inlet.stream_type
             print(
@@ -1,6 +1,6 @@
 """Module providing the MainAppPresenter class for MoBI_View."""
 
-from typing import Dict, List
+from typing import Dict, List, Sequence
 
 import numpy as np
 from PyQt6.QtCore import QTimer
@@ -23,6 +23,8 @@ class MainAppPresenter:
         channel_labels: List of labels for each channel in the sample.
     """
 
+    __slots__ = ("view", "data_inlets", "channel_visibility", "timer", "__weakref__")
+
     def __init__(
         self,
         view: interfaces.IMainAppView,
@@ -48,7 +50,7 @@ class MainAppPresenter:
     def _initialize_channels(self) -> None:
         """Initializes channel visibility and registers toggle callbacks."""
         for inlet in self.data_inlets:
-            for channel_label in inlet.channel_info["labels"]:
+            for channel_label in inlet.channel_labels:
                 channel_name = f"{inlet.stream_name}:{channel_label}"
                 self.channel_visibility[channel_name] = True
                 self.view.set_plot_channel_visibility(channel_name, True)
@@ -57,6 +59,9 @@ class MainAppPresenter:
     def poll_data(self) -> None:
         """Polls each DataInlet for new data and updates the View accordingly.
 
+        The View is flushed once after every inlet has been polled, so each plot is
+        redrawn at most once per poll.
+
         Raises:
             StreamLostError: If connection to a data stream is lost or interrupted.
             InvalidChannelCountError: If the received data has an unexpected number
@@ -67,13 +72,10 @@ class MainAppPresenter:
         """
         for inlet in self.data_inlets:
             try:
-                inlet.pull_sample()
-                if inlet.ptr == 0:
+                samples = inlet.pull_chunk()
+                if len(samples) == 0:
                     continue
-                latest_index = (inlet.ptr - 1) % config.Config.BUFFER_SIZE
-                sample = inlet.buffers[latest_index]
-                channel_labels = inlet.channel_info["labels"]
-                self.on_data_updated(inlet.stream_name, sample, channel_labels)
+                self.on_data_updated(inlet.stream_name, samples, inlet.channel_labels)
             except exceptions.StreamLostError as e:
                 self.view.display_error(str(e))
             except exceptions.InvalidChannelCountError as e:
@@ -82,20 +84,24 @@ class MainAppPresenter:
                 self.view.display_error(str(e))
             except Exception as e:
                 self.view.display_error(f"Unexpected error: {str(e)}")
+        self.view.flush()
 
     def on_data_updated(
-        self, stream_name: str, sample: np.ndarray, channel_labels: List[str]
+        self,
+        stream_name: str,
+        samples: np.ndarray,
+        channel_labels: Sequence[str],
     ) -> None:
         """Handles data updates from DataInlet instances and updates the View.
 
         Args:
             stream_name: Identifier for the data source.
-            sample: The new data sample as a NumPy array.
-            channel_labels: List of labels for each channel in the sample.
+            samples: The new samples as a (n_samples, n_channels) NumPy array.
+            channel_labels: Labels for each channel in the samples.
         """
         plot_data = {
             "stream_name": stream_name,
-            "data": sample.tolist(),
+            "data": samples,
             "channel_labels": channel_labels,
         }
         self.view.update_plot(plot_data)
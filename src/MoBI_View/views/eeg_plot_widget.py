@@ -4,29 +4,33 @@ Displays all EEG data in a single PlotWidget with each channel vertically offset
 and labeled. Only the bottom axis is shown.
 """
 
-from typing import Dict, List
+from typing import Dict, Optional, Sequence, Set
 
 import numpy as np
 import pyqtgraph as pg
-from PyQt6 import QtWidgets
+from PyQt6 import QtGui, QtWidgets
 
-from MoBI_View.core import config, exceptions
+from MoBI_View.core import config, exceptions, ring_buffer
 
 
 class EEGPlotWidget(QtWidgets.QWidget):
     """Displays all EEG data in one PlotWidget with vertical offsets and labels.
 
     Channels are stacked vertically with labels on the left side.
-    Hidden channels are automatically removed without leaving gaps.
+    Hidden channels are automatically removed without leaving gaps. Incoming
+    samples are only buffered; the plot lines are redrawn by flush().
 
     Attributes:
         _layout: The main QtWidgets.QVBoxLayout for this widget.
         _plot_widget: The pyqtgraph PlotWidget used to display EEG signals.
-        _buffers: Maps each channel name to a list of float samples.
+        _buffers: Maps each channel name to the RingBuffer of its samples.
+        _x_data: Cached x-axis sample indices shared by all channels.
         _data_items: Maps each channel name to its PlotDataItem in the PlotWidget.
         _channel_order: Maps each channel name to an integer index for offset order.
         _text_items: Maps each channel name to its text label item in the PlotWidget.
         _channel_visible: Maps each channel name to a bool indicating visibility.
+        _pen: Shared white 1-pixel pen used by every channel's plot line.
+        _dirty: Names of channels with data not yet drawn.
     """
 
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
@@ -41,17 +45,26 @@ class EEGPlotWidget(QtWidgets.QWidget):
 
         self._plot_widget: pg.PlotWidget = pg.PlotWidget()
         self._plot_widget.showGrid(x=True, y=True)
+        self._plot_widget.setDownsampling(auto=True, mode="peak")
+        self._plot_widget.setClipToView(True)
         self._plot_widget.getAxis("left").setStyle(showValues=False)
         self._layout.addWidget(self._plot_widget)
 
-        self._buffers: Dict[str, List[float]] = {}
+        self._buffers: Dict[str, ring_buffer.RingBuffer] = {}
+        self._x_data: np.ndarray = np.arange(config.Config.MAX_SAMPLES)
         self._data_items: Dict[str, pg.PlotDataItem] = {}
         self._channel_order: Dict[str, int] = {}
         self._text_items: Dict[str, pg.TextItem] = {}
         self._channel_visible: Dict[str, bool] = {}
+        self._pen: QtGui.QPen = pg.mkPen(width=1, color="w")
+        self._dirty: Set[str] = set()
 
     def add_channel(
-        self, channel_name: str, offset: int = config.Config.EEG_OFFSET
+        self,
+        channel_name: str,
+        offset: int = config.Config.EEG_OFFSET,
+        max_samples: int = config.Config.MAX_SAMPLES,
+        short_name: Optional[str] = None,
     ) -> None:
         """Adds a new channel to the EEG plot with vertical positioning and labeling.
 
@@ -66,8 +79,12 @@ class EEGPlotWidget(QtWidgets.QWidget):
 
         Args:
             channel_name: Fully qualified identifier, e.g. "EEGStream:Fz".
-                The part after ":" will be displayed as the channel label.
+                The part after ":" will be displayed as the channel label unless
+                short_name is given.
             offset: Vertical spacing between channels in plot units.
+            max_samples: Number of samples kept in the channel's ring buffer.
+            short_name: Label to display for the channel, e.g. "Fz". Callers that
+                already know it can pass it to skip parsing channel_name.
 
         Raises:
             DuplicateChannelLabelError: If a channel with this name already exists.
@@ -78,20 +95,47 @@ class EEGPlotWidget(QtWidgets.QWidget):
             )
         idx = len(self._channel_order)
         self._channel_order[channel_name] = idx
-        self._buffers[channel_name] = []
+        self._buffers[channel_name] = ring_buffer.RingBuffer(max_samples)
         self._channel_visible[channel_name] = True
 
-        pen = pg.mkPen(width=1, color="w")
-        data_item = self._plot_widget.plot([], [], pen=pen)
+        data_item = self._plot_widget.plot([], [], pen=self._pen)
         self._data_items[channel_name] = data_item
 
-        text_item = pg.TextItem(
-            text=channel_name.split(":", 1)[-1], color="w", anchor=(1, 0.5)
-        )
+        if short_name is None:
+            short_name = channel_name.split(":", 1)[-1]
+        text_item = pg.TextItem(text=short_name, color="w", anchor=(1, 0.5))
         text_item.setPos(-10, idx * offset)
+        data_item.setPos(0, idx * offset)
         self._plot_widget.addItem(text_item)
         self._text_items[channel_name] = text_item
 
+    def declare_channels(
+        self,
+        channel_names: Sequence[str],
+        short_names: Optional[Sequence[str]] = None,
+        offset: int = config.Config.EEG_OFFSET,
+        max_samples: int = config.Config.MAX_SAMPLES,
+    ) -> None:
+        """Creates the plot items of several channels in one pass.
+
+        Channels that already exist are skipped.
+
+        Args:
+            channel_names: Fully qualified identifiers, e.g. ["EEGStream:Fz"].
+            short_names: Optional display labels, one per channel.
+            offset: Vertical spacing between channels in plot units.
+            max_samples: Number of samples kept in each channel's ring buffer.
+        """
+        for idx, channel_name in enumerate(channel_names):
+            if channel_name in self._channel_order:
+                continue
+            self.add_channel(
+                channel_name,
+                offset=offset,
+                max_samples=max_samples,
+                short_name=short_names[idx] if short_names else None,
+            )
+
     def update_data(
         self,
         channel_name: str,
@@ -100,25 +144,81 @@ class EEGPlotWidget(QtWidgets.QWidget):
         max_samples: int = config.Config.MAX_SAMPLES,
         offset: int = config.Config.EEG_OFFSET,
     ) -> None:
-        """Appends a new sample to a channel's buffer and updates its plot.
+        """Writes a new sample into a channel's ring buffer and marks it for redraw.
 
         Creates the channel if it does not exist yet (lazy initialization).
-        Controls visibility and manages buffer size to maintain a sliding window.
+        Controls visibility and overwrites the oldest sample once the buffer is
+        full to maintain a sliding window. The sample is written as a one-sample
+        block through update_block(), so single samples and blocks share one write
+        path.
 
         Args:
             channel_name: Fully qualified identifier, e.g. "EEGStream:Fz".
             sample_val: The new sample value.
             visible: Whether the channel should be visible.
-            max_samples: Maximum number of samples to keep in the buffer.
+            max_samples: Maximum number of samples to keep in the buffer. Only used
+                when the channel is created by this call.
             offset: Vertical offset between channels.
         """
-        if channel_name not in self._channel_order:
-            self.add_channel(channel_name, offset=offset)
+        self.update_block(
+            [channel_name],
+            np.full((1, 1), sample_val, dtype=np.float32),
+            [visible],
+            max_samples=max_samples,
+            offset=offset,
+        )
+
+    def update_block(
+        self,
+        channel_names: Sequence[str],
+        block: np.ndarray,
+        visible: Sequence[bool],
+        max_samples: int = config.Config.MAX_SAMPLES,
+        offset: int = config.Config.EEG_OFFSET,
+        short_names: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Writes a block of samples into the ring buffers of several channels.
 
-        self._buffers[channel_name].append(sample_val)
-        if len(self._buffers[channel_name]) > max_samples:
-            self._buffers[channel_name].pop(0)
+        Each column of the block is copied into its channel's ring buffer with at
+        most four slice assignments, instead of one Python call per sample. Missing
+        channels are created, visibility is applied and the visible channels are
+        marked for redraw on the next flush(); hidden channels keep buffering but
+        are not redrawn until they are shown again.
 
+        Args:
+            channel_names: Fully qualified identifiers, one per column of the block.
+            block: Samples shaped (n_samples, n_channels), oldest first.
+            visible: Whether each channel should be visible.
+            max_samples: Maximum number of samples to keep in the buffer. Only used
+                for channels created by this call.
+            offset: Vertical offset between channels.
+            short_names: Optional display labels, one per channel, used for
+                channels created by this call.
+        """
+        for col, channel_name in enumerate(channel_names):
+            if channel_name not in self._channel_order:
+                self.add_channel(
+                    channel_name,
+                    offset=offset,
+                    max_samples=max_samples,
+                    short_name=short_names[col] if short_names else None,
+                )
+            self._buffers[channel_name].write(block[:, col])
+            self._apply_visibility(channel_name, visible[col], offset=offset)
+
+    def _apply_visibility(
+        self,
+        channel_name: str,
+        visible: bool,
+        offset: int = config.Config.EEG_OFFSET,
+    ) -> None:
+        """Applies a channel's visibility and marks it for redraw when visible.
+
+        Args:
+            channel_name: Fully qualified identifier, e.g. "EEGStream:Fz".
+            visible: Whether the channel should be visible.
+            offset: Vertical spacing between channels in plot units.
+        """
         old_vis = self._channel_visible[channel_name]
         if old_vis != visible:
             self._channel_visible[channel_name] = visible
@@ -127,36 +227,56 @@ class EEGPlotWidget(QtWidgets.QWidget):
         self._data_items[channel_name].setVisible(visible)
         self._text_items[channel_name].setVisible(visible)
 
-        idx = self._channel_order[channel_name]
-        x_data = np.arange(len(self._buffers[channel_name]))
-        y_data = np.array(self._buffers[channel_name]) + idx * offset
-        self._data_items[channel_name].setData(x_data, y_data)
+        if visible:
+            self._dirty.add(channel_name)
+
+    def flush(self) -> None:
+        """Redraws every visible channel that received data since the last flush."""
+        if not self._dirty:
+            return
+        for channel_name in self._dirty:
+            if self._channel_visible[channel_name]:
+                self._plot_channel(channel_name)
+        self._dirty.clear()
+
+    def _plot_channel(self, channel_name: str) -> None:
+        """Hands a snapshot of a channel's buffered samples to its plot line.
+
+        The x-axis is a slice of the cached index array, which only grows when a
+        channel holds more samples than it covers. The vertical offset is applied by
+        the position of the PlotDataItem, not to the data.
+
+        Args:
+            channel_name: Fully qualified identifier, e.g. "EEGStream:Fz".
+        """
+        y_data = self._buffers[channel_name].snapshot()
+        n_samples = len(y_data)
+        if n_samples > len(self._x_data):
+            self._x_data = np.arange(n_samples)
+        self._data_items[channel_name].setData(self._x_data[:n_samples], y_data)
 
     def _reassign_offsets(self, offset: int = config.Config.EEG_OFFSET) -> None:
         """Reassigns offsets among only the visible channels to avoid gaps.
 
         This method adjusts the vertical positions of channels when visibility changes.
-        It collects all currently visible channels, maintains their relative order,
-        and assigns new sequential indices to ensure continuous spacing without gaps.
+        It collects all currently visible channels in the order they were added (the
+        insertion order of _channel_order) and assigns new sequential indices to
+        ensure continuous spacing without gaps.
 
-        The text labels are repositioned according to the new indices, and all plot
-        data is recalculated with updated y-coordinates. This ensures that when channels
-        are hidden or shown, the remaining visible channels are displayed with proper
-        spacing and visual continuity.
+        Only channels whose index changed are moved. Their plot lines and text labels
+        are translated to the new position; the plotted data itself is left
+        untouched, so no samples are copied or redrawn. This ensures that when
+        channels are hidden or shown, the remaining visible channels are displayed
+        with proper spacing and visual continuity.
 
         Args:
             offset: Vertical spacing between channels in plot units.
         """
         visible_chs = [ch for ch in self._channel_order if self._channel_visible[ch]]
-        visible_chs.sort(key=lambda ch: self._channel_order[ch])
 
         for new_idx, ch in enumerate(visible_chs):
+            if self._channel_order[ch] == new_idx:
+                continue
             self._channel_order[ch] = new_idx
+            self._data_items[ch].setPos(0, new_idx * offset)
             self._text_items[ch].setPos(-10, new_idx * offset)
-
-        for ch in visible_chs:
-            buf = self._buffers[ch]
-            idx = self._channel_order[ch]
-            x_data = np.arange(len(buf))
-            y_data = np.array(buf) + idx * offset
-            self._data_items[ch].setData(x_data, y_data)
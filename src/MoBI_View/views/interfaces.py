@@ -17,7 +17,7 @@ class IMainAppView(Protocol):
             data: A dictionary containing the data to be plotted. Expected format:
                 {
                     "stream_name": str,
-                    "data": List[float] or List[List[float]]
+                    "data": np.ndarray, List[float] or List[List[float]]
                 }
         """
 
@@ -29,6 +29,9 @@ class IMainAppView(Protocol):
             visible: A boolean indicating whether the channel should be visible.
         """
 
+    def flush(self) -> None:
+        """Redraws the plots with the data received since the last flush."""
+
     def display_error(self, message: str) -> None:
         """Displays an error message to the user.
 
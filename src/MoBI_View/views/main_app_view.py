@@ -7,13 +7,46 @@ control panel for toggling channel visibility. Also adds a reset button in the s
 bar to restore the control panel.
 """
 
-from typing import Dict, cast
+from typing import Dict, List, Sequence, Set, cast
 
+import numpy as np
 from PyQt6 import QtCore, QtWidgets
 
 from MoBI_View.views import eeg_plot_widget, numeric_plot_widget
 
 
+class _StreamTreeItem(QtWidgets.QTreeWidgetItem):
+    """Auto-tristate tree item for a stream that cascades check changes in one pass.
+
+    Qt applies a new check state of an auto-tristate item to every child item, and
+    each child would emit itemChanged on its own. This item instead suspends the
+    tree's repaints and signals while Qt cascades the state, and then emits
+    itemChanged once for the stream item itself.
+    """
+
+    def setData(self, column: int, role: int, value: object) -> None:
+        """Sets the item's data, cascading check state changes without re-entry.
+
+        Args:
+            column: The column whose data is set.
+            role: The data role being set.
+            value: The new value.
+        """
+        tree = self.treeWidget()
+        if role != QtCore.Qt.ItemDataRole.CheckStateRole or tree is None:
+            super().setData(column, role, value)
+            return
+        tree.setUpdatesEnabled(False)
+        was_blocked = tree.blockSignals(True)
+        try:
+            super().setData(column, role, value)
+        finally:
+            tree.blockSignals(was_blocked)
+            tree.setUpdatesEnabled(True)
+        if not was_blocked:
+            tree.itemChanged.emit(self, column)
+
+
 class MainAppView(QtWidgets.QMainWindow):
     """Main application window for MoBI_View.
 
@@ -22,8 +55,13 @@ class MainAppView(QtWidgets.QMainWindow):
     the mapping between data streams and their visual representations.
 
     Attributes:
-        _channel_visibility: Maps "Stream:Channel" to bool indicating visibility.
-        _stream_types: Maps stream names to a string describing the stream type.
+        _hidden_channels: Set of "Stream:Channel" names that are hidden. Channels not
+            in the set are visible.
+        _eeg_streams: Names of the streams whose type is "EEG".
+        _channel_names: Maps stream names to the fully qualified "Stream:Channel"
+            names of their channels, in sample order.
+        _channel_labels: Maps stream names to the display labels of their
+            channels, in sample order.
         _tab_widget: QtWidgets.QTabWidget containing the EEG and numeric-data tabs.
         _eeg_tab: eeg_plot_widget.EEGPlotWidget for displaying EEG data.
         _numeric_tab: numeric_plot_widget.MultiStreamNumericContainer for displaying
@@ -47,8 +85,12 @@ class MainAppView(QtWidgets.QMainWindow):
         """
         super().__init__(parent)
         self.setWindowTitle("MoBI_View")
-        self._channel_visibility: Dict[str, bool] = {}
-        self._stream_types: Dict[str, str] = stream_info
+        self._hidden_channels: Set[str] = set()
+        self._eeg_streams: Set[str] = {
+            name for name, stream_type in stream_info.items() if stream_type == "EEG"
+        }
+        self._channel_names: Dict[str, List[str]] = {}
+        self._channel_labels: Dict[str, List[str]] = {}
 
         self._init_ui()
         self.show()
@@ -105,6 +147,7 @@ class MainAppView(QtWidgets.QMainWindow):
         """Creates and configures the tree widget for stream and channel control."""
         self._tree_widget = QtWidgets.QTreeWidget()
         self._tree_widget.setHeaderLabel("Streams / Channels")
+        self._tree_widget.setUniformRowHeights(True)
         self._dock.setWidget(self._tree_widget)
         self._tree_widget.itemChanged.connect(self._on_tree_item_changed)
 
@@ -128,13 +171,19 @@ class MainAppView(QtWidgets.QMainWindow):
         that controls channel visibility. It ensures each stream appears only once as
         a top-level item, and each channel appears as a child of its parent stream.
 
-        When a new stream is encountered, this method creates a checkable tree item
-        for it and initializes tracking structures. When a new channel is encountered,
-        it creates a child item under the appropriate stream with the display name
-        extracted from the full channel identifier. (Lazy initialization)
+        When a new stream is encountered, this method creates a checkable,
+        auto-tristate tree item for it and initializes tracking structures. When a
+        new channel is encountered, it creates a child item under the appropriate
+        stream with the display name extracted from the full channel identifier.
+        (Lazy initialization)
 
         All items are initially created in the checked (visible) state and are made
-        user-checkable to allow toggling visibility through the control panel.
+        user-checkable to allow toggling visibility through the control panel. Each
+        channel item stores its fully qualified name under the UserRole so toggles
+        can be resolved without rebuilding it from the item texts. The tree's signals
+        are blocked while a channel item is built, so _on_tree_item_changed does not
+        see the item until it is complete. Channels of EEG streams are also declared
+        on the EEG tab here, so their plot items exist before the first data arrives.
 
         Args:
             stream_name: Name of the LSL stream (e.g., "EEGStream").
@@ -142,53 +191,100 @@ class MainAppView(QtWidgets.QMainWindow):
                 (e.g., "EEGStream:Fz").
         """
         if stream_name not in self._stream_items:
-            stream_item = QtWidgets.QTreeWidgetItem(self._tree_widget)
+            stream_item = _StreamTreeItem(self._tree_widget)
             stream_item.setText(0, stream_name)
-            flags = stream_item.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable
+            flags = (
+                stream_item.flags()
+                | QtCore.Qt.ItemFlag.ItemIsUserCheckable
+                | QtCore.Qt.ItemFlag.ItemIsAutoTristate
+            )
             stream_item.setFlags(flags)
             stream_item.setCheckState(0, QtCore.Qt.CheckState.Checked)
             self._stream_items[stream_name] = stream_item
 
         if channel_name not in self._channel_items:
             parent_item = self._stream_items[stream_name]
-            channel_item = QtWidgets.QTreeWidgetItem(parent_item)
-            channel_item.setText(0, channel_name.split(":", 1)[-1])
-            flags = channel_item.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable
-            channel_item.setFlags(flags)
-            channel_item.setCheckState(0, QtCore.Qt.CheckState.Checked)
+            short_name = channel_name.split(":", 1)[-1]
+            was_blocked = self._tree_widget.blockSignals(True)
+            try:
+                channel_item = QtWidgets.QTreeWidgetItem(parent_item)
+                channel_item.setText(0, short_name)
+                flags = channel_item.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable
+                channel_item.setFlags(flags)
+                channel_item.setCheckState(0, QtCore.Qt.CheckState.Checked)
+                channel_item.setData(0, QtCore.Qt.ItemDataRole.UserRole, channel_name)
+            finally:
+                self._tree_widget.blockSignals(was_blocked)
             self._channel_items[channel_name] = channel_item
+            if stream_name in self._eeg_streams:
+                self._eeg_tab.declare_channels([channel_name], short_names=[short_name])
 
     def update_plot(self, data: dict) -> None:
         """Updates the plots with new data from a stream.
 
         Routes incoming data samples to the appropriate visualization tab based on
         the stream type. EEG data is sent to the EEG tab, while all other data types
-        are sent to the numeric data tab.
+        are sent to the numeric data tab. Both receive the samples as one block.
 
         Args:
             data: A dictionary containing stream data with keys:
                 "stream_name": Name of the data stream.
-                "data": List of sample values.
+                "data": Sample values, as a list, a 1-D NumPy array holding one
+                    sample, or a 2-D (n_samples, n_channels) NumPy array holding
+                    a block of samples in arrival order.
                 "channel_labels": List of channel names corresponding to samples
                     (not fully qualified).
         """
         stream_name = data.get("stream_name", "")
-        sample_list = data.get("data", [])
-        channel_labels = data.get("channel_labels", [])
-        for idx, val in enumerate(sample_list):
-            label = (
+        samples = np.atleast_2d(data.get("data", []))
+        if samples.size == 0:
+            return
+        channel_names = self._get_channel_names(
+            stream_name, data.get("channel_labels", []), samples.shape[1]
+        )
+        hidden = self._hidden_channels
+        visible = [ch not in hidden for ch in channel_names]
+        if stream_name in self._eeg_streams:
+            self._eeg_tab.update_block(
+                channel_names,
+                samples,
+                visible,
+                short_names=self._channel_labels[stream_name],
+            )
+        else:
+            self._numeric_tab.update_numeric_block(
+                stream_name, channel_names, samples, visible
+            )
+
+    def _get_channel_names(
+        self, stream_name: str, channel_labels: Sequence[str], n_channels: int
+    ) -> List[str]:
+        """Returns the fully qualified channel names of a stream.
+
+        The names are built once per stream and cached, together with the display
+        labels they were built from. Channels without a label are named
+        "Channel<N>" using their 1-based position.
+
+        Args:
+            stream_name: Name of the data stream.
+            channel_labels: Channel labels of the stream (not fully qualified).
+            n_channels: Number of channels in each sample.
+
+        Returns:
+            One "Stream:Channel" name per channel, in sample order.
+        """
+        channel_names = self._channel_names.get(stream_name)
+        if channel_names is None or len(channel_names) != n_channels:
+            labels = [
                 channel_labels[idx]
                 if idx < len(channel_labels)
                 else f"Channel{idx + 1}"
-            )
-            chan_name = f"{stream_name}:{label}"
-            visible = self._channel_visibility[chan_name]
-            if self._stream_types.get(stream_name) == "EEG":
-                self._eeg_tab.update_data(chan_name, val, visible)
-            else:
-                self._numeric_tab.update_numeric_containers(
-                    stream_name, chan_name, val, visible
-                )
+                for idx in range(n_channels)
+            ]
+            channel_names = [f"{stream_name}:{label}" for label in labels]
+            self._channel_names[stream_name] = channel_names
+            self._channel_labels[stream_name] = labels
+        return channel_names
 
     def set_plot_channel_visibility(self, channel_name: str, visible: bool) -> None:
         """Toggles the visibility of a channel.
@@ -197,7 +293,18 @@ class MainAppView(QtWidgets.QMainWindow):
             channel_name: Fully qualified channel identifier (e.g., "EEGStream:Fz").
             visible: True to show the channel, False to hide it.
         """
-        self._channel_visibility[channel_name] = visible
+        if visible:
+            self._hidden_channels.discard(channel_name)
+        else:
+            self._hidden_channels.add(channel_name)
+
+    def flush(self) -> None:
+        """Redraws the EEG and numeric plots with data received since the last flush.
+
+        Called by the presenter once per poll, after every stream has been updated.
+        """
+        self._eeg_tab.flush()
+        self._numeric_tab.flush()
 
     def display_error(self, message: str) -> None:
         """Displays an error message via a dialog and updates the status bar.
@@ -212,23 +319,31 @@ class MainAppView(QtWidgets.QMainWindow):
     def _on_tree_item_changed(self, item: QtWidgets.QTreeWidgetItem) -> None:
         """Handles changes in the control panel tree to update channel visibility.
 
-        When a top-level (stream) item is clicked, this method applies the same
-        visibility state to all child (channel) items. When a child item is
-        clicked, it updates only that specific channel's visibility.
+        Stream items are auto-tristate, so Qt applies a stream's new check state to
+        all of its channel items and shows a partially checked stream when only some
+        channels are visible. The stream item cascades with the tree's repaints and
+        signals suspended and emits itemChanged once, so a stream change is handled
+        here in one pass that updates the visibility of each of its channels. A
+        channel change updates only that channel's visibility. Channel items that
+        have no UserRole name yet are ignored.
 
         Args:
             item: The tree widget item that was changed.
         """
-        parent_item = item.parent()
-        if parent_item is None:
+        user_role = QtCore.Qt.ItemDataRole.UserRole
+        if item.parent() is None:
             new_state = item.checkState(0)
+            if new_state == QtCore.Qt.CheckState.PartiallyChecked:
+                return
+            is_visible = new_state == QtCore.Qt.CheckState.Checked
             for i in range(item.childCount()):
                 child = item.child(i)
-                if child is not None:
-                    child.setCheckState(0, new_state)
-        else:
-            short_name = item.text(0)
-            stream_name = parent_item.text(0)
-            full_name = f"{stream_name}:{short_name}"
-            is_visible = item.checkState(0) == QtCore.Qt.CheckState.Checked
-            self.set_plot_channel_visibility(full_name, is_visible)
+                full_name = child.data(0, user_role) if child is not None else None
+                if full_name is not None:
+                    self.set_plot_channel_visibility(full_name, is_visible)
+            return
+        full_name = item.data(0, user_role)
+        if full_name is None:
+            return
+        is_visible = item.checkState(0) == QtCore.Qt.CheckState.Checked
+        self.set_plot_channel_visibility(full_name, is_visible)
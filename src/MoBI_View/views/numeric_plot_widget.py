@@ -3,18 +3,24 @@
 Displays one numeric stream in a PlotWidget with multiple channels.
 """
 
-from typing import Dict, List
+from typing import Dict, Sequence, Set
 
+import numpy as np
 import pyqtgraph as pg
 from PyQt6 import QtWidgets
 
-from MoBI_View.core import config, exceptions
+from MoBI_View.core import config, exceptions, ring_buffer
+
+_COLOR_TABLE = tuple(
+    tuple(pg.intColor(index, values=3, hues=7).getRgb()[:3]) for index in range(21)
+)
 
 
 class SingleStreamNumericPlotWidget(QtWidgets.QWidget):
     """Displays one numeric stream in a PlotWidget with multiple channels.
 
-    The plot title displays the stream name.
+    The plot title displays the stream name. Incoming samples are only buffered;
+    the plot lines are redrawn by flush().
 
     Attributes:
         _stream_name: The name of the numeric stream (e.g. "GazeStream").
@@ -22,7 +28,11 @@ class SingleStreamNumericPlotWidget(QtWidgets.QWidget):
             widget vertically.
         _plot_widget: The pyqtgraph PlotWidget used to display numeric signals.
         _channel_data_items: Maps channel names to PlotDataItem objects.
-        _buffers: Maps channel names to lists of float samples.
+        _buffers: Maps channel names to the RingBuffer of their samples. Samples are
+            stored as float64, which holds every integer and double stream value
+            exactly.
+        _x_data: Cached x-axis sample indices shared by all channels.
+        _dirty: Names of channels with data not yet drawn.
     """
 
     def __init__(
@@ -41,32 +51,41 @@ class SingleStreamNumericPlotWidget(QtWidgets.QWidget):
 
         self._plot_widget: pg.PlotWidget = pg.PlotWidget()
         self._plot_widget.showGrid(x=True, y=True)
+        self._plot_widget.setDownsampling(auto=True, mode="peak")
+        self._plot_widget.setClipToView(True)
         self._plot_widget.getPlotItem().setTitle(
             self._stream_name, color="w", bold=True, size="20pt"
         )
         self._layout.addWidget(self._plot_widget)
 
         self._channel_data_items: Dict[str, pg.PlotDataItem] = {}
-        self._buffers: Dict[str, List[float]] = {}
+        self._buffers: Dict[str, ring_buffer.RingBuffer] = {}
+        self._x_data: np.ndarray = np.arange(config.Config.MAX_SAMPLES)
+        self._dirty: Set[str] = set()
 
     def define_channel_color(self, index: int) -> tuple:
         """Defines a distinct color for a channel based on its index.
 
+        Colors cycle through a table of 7 hues at 3 brightness values that is built
+        once at import.
+
         Args:
             index: The 0-based index of the channel.
 
         Returns:
             A tuple (R, G, B) in [0, 255].
         """
-        r, g, b = pg.intColor(index, values=3, hues=7).getRgb()[:3]
-        return (r, g, b)
+        return _COLOR_TABLE[index % len(_COLOR_TABLE)]
 
-    def add_channel(self, channel_name: str) -> None:
+    def add_channel(
+        self, channel_name: str, max_samples: int = config.Config.MAX_SAMPLES
+    ) -> None:
         """Adds a new channel to the numeric plot.
 
         Args:
             channel_name: The fully qualified channel identifier
                 (e.g. "Eyetracking:Gaze_X").
+            max_samples: The maximum number of samples to keep in the buffer.
 
         Raises:
             DuplicateChannelLabelError: If a duplicate channel is added to the stream.
@@ -76,13 +95,14 @@ class SingleStreamNumericPlotWidget(QtWidgets.QWidget):
                 "Unable to add a duplicate channel label under the same stream."
             )
         idx = len(self._channel_data_items)
-        color_rgb = self.define_channel_color(idx)
-        pen = pg.mkPen(color=color_rgb, width=2)
+        pen = pg.mkPen(color=self.define_channel_color(idx), width=2)
         short_label = channel_name.split(":", 1)[-1]
 
         data_item = self._plot_widget.plot(name=short_label, pen=pen, symbol=None)
         self._channel_data_items[channel_name] = data_item
-        self._buffers[channel_name] = []
+        self._buffers[channel_name] = ring_buffer.RingBuffer(
+            max_samples, dtype=np.float64
+        )
 
     def update_data(
         self,
@@ -91,29 +111,87 @@ class SingleStreamNumericPlotWidget(QtWidgets.QWidget):
         visible: bool,
         max_samples: int = config.Config.MAX_SAMPLES,
     ) -> None:
-        """Appends a new sample to the channel buffer and updates the plot.
+        """Writes a new sample into the channel's ring buffer and marks it for redraw.
 
         Creates the channel if it does not exist yet (lazy initialization).
         Controls the visibility of the channel based on the `visible` parameter.
+        Once the buffer is full, the oldest sample is dropped. The sample is written
+        as a one-sample block through update_block(), so single samples and blocks
+        share one write path.
 
         Args:
             channel_name: The fully qualified channel identifier
                 (e.g. "Eyetracking:Gaze_X").
             sample_val: The new data sample.
             visible: Whether the channel should be visible.
-            max_samples: The maximum number of samples to keep in the buffer.
+            max_samples: The maximum number of samples to keep in the buffer. Only
+                used when the channel is created by this call.
         """
-        if channel_name not in self._channel_data_items:
-            self.add_channel(channel_name)
+        self.update_block(
+            [channel_name],
+            np.full((1, 1), sample_val, dtype=np.float64),
+            [visible],
+            max_samples=max_samples,
+        )
 
-        self._buffers[channel_name].append(sample_val)
-        if len(self._buffers[channel_name]) > max_samples:
-            self._buffers[channel_name].pop(0)
+    def update_block(
+        self,
+        channel_names: Sequence[str],
+        block: np.ndarray,
+        visible: Sequence[bool],
+        max_samples: int = config.Config.MAX_SAMPLES,
+    ) -> None:
+        """Writes a block of samples into the ring buffers of several channels.
 
-        x_data = range(len(self._buffers[channel_name]))
-        data_item = self._channel_data_items[channel_name]
-        data_item.setVisible(visible)
-        data_item.setData(x_data, self._buffers[channel_name])
+        Each column of the block is copied into its channel's ring buffer with at
+        most four slice assignments, instead of one Python call per sample. Missing
+        channels are created, visibility is applied and the visible channels are
+        redrawn on the next flush().
+
+        Args:
+            channel_names: Fully qualified identifiers, one per column of the block.
+            block: Samples shaped (n_samples, n_channels), oldest first.
+            visible: Whether each channel should be visible.
+            max_samples: The maximum number of samples to keep in the buffer. Only
+                used for channels created by this call.
+        """
+        for col, channel_name in enumerate(channel_names):
+            if channel_name not in self._channel_data_items:
+                self.add_channel(channel_name, max_samples=max_samples)
+            self._buffers[channel_name].write(block[:, col])
+            self._apply_visibility(channel_name, visible[col])
+
+    def _apply_visibility(self, channel_name: str, visible: bool) -> None:
+        """Applies a channel's visibility and marks it for redraw when visible.
+
+        Args:
+            channel_name: The fully qualified channel identifier
+                (e.g. "Eyetracking:Gaze_X").
+            visible: Whether the channel should be visible.
+        """
+        self._channel_data_items[channel_name].setVisible(visible)
+        if visible:
+            self._dirty.add(channel_name)
+
+    def flush(self) -> None:
+        """Redraws every visible channel that received data since the last flush.
+
+        Each plot line receives a snapshot of its channel's buffered samples. The
+        snapshot array is reused and overwritten in place on the next flush, right
+        before the plot line is given its new data.
+        """
+        if not self._dirty:
+            return
+        for channel_name in self._dirty:
+            data_item = self._channel_data_items[channel_name]
+            if not data_item.isVisible():
+                continue
+            y_data = self._buffers[channel_name].snapshot()
+            n_samples = len(y_data)
+            if n_samples > len(self._x_data):
+                self._x_data = np.arange(n_samples)
+            data_item.setData(self._x_data[:n_samples], y_data)
+        self._dirty.clear()
 
 
 class MultiStreamNumericContainer(QtWidgets.QWidget):
@@ -140,8 +218,8 @@ class MultiStreamNumericContainer(QtWidgets.QWidget):
     ) -> None:
         """Updates data for a specific channel in a numeric stream.
 
-        Creates a new stream widget if it's the first time the stream is encountered.
-        (lazy initialization)
+        The sample is forwarded as a one-sample block through
+        update_numeric_block().
 
         Args:
             stream_name: The name of the numeric stream.
@@ -150,9 +228,39 @@ class MultiStreamNumericContainer(QtWidgets.QWidget):
             sample_val: The new data sample.
             visible: Whether the channel should be visible.
         """
+        self.update_numeric_block(
+            stream_name,
+            [channel_name],
+            np.full((1, 1), sample_val, dtype=np.float64),
+            [visible],
+        )
+
+    def update_numeric_block(
+        self,
+        stream_name: str,
+        channel_names: Sequence[str],
+        block: np.ndarray,
+        visible: Sequence[bool],
+    ) -> None:
+        """Updates several channels of a numeric stream with a block of samples.
+
+        Creates a new stream widget if it's the first time the stream is encountered.
+        (lazy initialization)
+
+        Args:
+            stream_name: The name of the numeric stream.
+            channel_names: Fully qualified identifiers, one per column of the block.
+            block: Samples shaped (n_samples, n_channels), oldest first.
+            visible: Whether each channel should be visible.
+        """
         if stream_name not in self._stream_plots:
             plot_widget = SingleStreamNumericPlotWidget(stream_name)
             self._stream_plots[stream_name] = plot_widget
             self._layout.addWidget(plot_widget)
 
-        self._stream_plots[stream_name].update_data(channel_name, sample_val, visible)
+        self._stream_plots[stream_name].update_block(channel_names, block, visible)
+
+    def flush(self) -> None:
+        """Redraws every stream plot with data received since the last flush."""
+        for plot_widget in self._stream_plots.values():
+            plot_widget.flush()
@@ -56,6 +56,10 @@ class MockMainAppView:
         """Record plot updates without updating UI."""
         pass
 
+    def flush(self) -> None:
+        """Skip redrawing plots."""
+        pass
+
     def display_error(self, message: str) -> None:
         """Print error messages instead of displaying in UI."""
         print(f"ERROR: {message}")
@@ -1,6 +1,6 @@
 """Unit tests for the DataInlet class in the MoBI_View package."""
 
-from typing import List, Tuple
+from typing import Any, List, Tuple
 from unittest.mock import MagicMock
 
 import numpy as np
@@ -61,8 +61,14 @@ def mock_stream_inlet(mocker: MockFixture) -> Tuple[MagicMock, List[float]]:
     """
     sample_data = [1.0, 2.0, 3.0]
 
+    def pull_chunk(
+        timeout: float, max_samples: int, dest_obj: np.ndarray
+    ) -> Tuple[Any, List[float]]:
+        dest_obj[0] = sample_data
+        return None, [0.0]
+
     inlet = mocker.MagicMock(spec=StreamInlet)
-    inlet.pull_sample = mocker.MagicMock(return_value=(sample_data, 0.0))
+    inlet.pull_chunk = mocker.MagicMock(side_effect=pull_chunk)
     return inlet, sample_data
 
 
@@ -110,12 +116,13 @@ def test_initialization(
 
     assert data_inlet_instance.channel_count == channel_count
     assert data_inlet_instance.channel_format == channel_format
-    assert data_inlet_instance.ptr == 0
-    assert data_inlet_instance.buffers.shape == (
+    assert data_inlet_instance._chunk_buffer.shape == (
         config.Config.BUFFER_SIZE,
         channel_count,
     )
+    assert data_inlet_instance._chunk_buffer.dtype == np.float32
     assert data_inlet_instance.channel_info["labels"] == channel_labels
+    assert data_inlet_instance.channel_labels == tuple(channel_labels)
     assert data_inlet_instance.channel_info["types"] == channel_types
     assert data_inlet_instance.channel_info["units"] == channel_units
     assert data_inlet_instance.stream_name == expected_name
@@ -260,21 +267,26 @@ def test_invalid_channel_format(
         data_inlet.DataInlet(info)
 
 
-@pytest.mark.parametrize("valid_channel_format", [1, 2, 4, 5, 6])
+@pytest.mark.parametrize(
+    "valid_channel_format,expected_dtype",
+    [(1, np.float32), (2, np.float64), (4, np.int32), (5, np.int16), (6, np.int8)],
+)
 def test_valid_channel_format(
     mocker: MockFixture,
     mock_lsl_info: Tuple[MagicMock, int, int, List[str], List[str], List[str]],
     valid_channel_format: int,
+    expected_dtype: type,
 ) -> None:
     """Parametrized test for channel_format validation in DataInlet initialization.
 
     Ensures that the `DataInlet` class initializes correctly when the channel format
-    is numeric.
+    is numeric, and that its buffer uses the stream's native data type.
 
     Args:
         mocker: Fixture for mocking objects.
         mock_lsl_info: Fixture providing mock StreamInfo.
         valid_channel_format: The channel format to test (Valid).
+        expected_dtype: The NumPy data type matching the channel format.
     """
     info, *_ = mock_lsl_info
     info.channel_format.return_value = valid_channel_format
@@ -286,16 +298,16 @@ def test_valid_channel_format(
     inlet = data_inlet.DataInlet(info)
 
     assert inlet.channel_format == valid_channel_format
+    assert inlet._chunk_buffer.dtype == expected_dtype
 
 
-def test_pull_sample_success(
+def test_pull_chunk_success(
     data_inlet_instance: data_inlet.DataInlet,
     mock_stream_inlet: Tuple[MagicMock, List[float]],
 ) -> None:
-    """Tests successfully pulling a sample from the LSL stream.
+    """Tests successfully pulling a chunk from the LSL stream.
 
-    Verifies that a sample is correctly pulled and stored in the buffer, and that
-    the pointer is incremented.
+    Verifies that a sample is correctly pulled and returned as a one-row block.
 
     Args:
         data_inlet_instance: Fixture providing the DataInlet instance.
@@ -303,29 +315,79 @@ def test_pull_sample_success(
     """
     _, sample_data = mock_stream_inlet
 
-    data_inlet_instance.pull_sample()
+    samples = data_inlet_instance.pull_chunk()
+
+    assert np.array_equal(samples, [sample_data])
+
+
+def test_pull_chunk_multiple_samples(
+    data_inlet_instance: data_inlet.DataInlet,
+    mock_stream_inlet: Tuple[MagicMock, List[float]],
+) -> None:
+    """Tests pulling a chunk holding several samples.
+
+    Verifies that every sample in the chunk is returned in arrival order, as a
+    view of the preallocated chunk array.
+
+    Args:
+        data_inlet_instance: Fixture providing the DataInlet instance.
+        mock_stream_inlet: Fixture providing mock StreamInlet.
+    """
+    inlet, _ = mock_stream_inlet
+    chunk = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]])
+
+    def pull_chunk(
+        timeout: float, max_samples: int, dest_obj: np.ndarray
+    ) -> Tuple[Any, List[float]]:
+        dest_obj[: len(chunk)] = chunk
+        return None, [0.0] * len(chunk)
+
+    inlet.pull_chunk.side_effect = pull_chunk
+
+    samples = data_inlet_instance.pull_chunk()
+
+    assert np.array_equal(samples, chunk)
+    assert np.shares_memory(samples, data_inlet_instance._chunk_buffer)
+
+
+def test_pull_chunk_no_samples(
+    data_inlet_instance: data_inlet.DataInlet,
+    mock_stream_inlet: Tuple[MagicMock, List[float]],
+) -> None:
+    """Tests pulling a chunk when no samples are available.
+
+    Ensures that an empty block with one column per channel is returned.
+
+    Args:
+        data_inlet_instance: Fixture providing the DataInlet instance.
+        mock_stream_inlet: Fixture providing mock StreamInlet.
+    """
+    inlet, _ = mock_stream_inlet
+    inlet.pull_chunk.side_effect = None
+    inlet.pull_chunk.return_value = (None, [])
+
+    samples = data_inlet_instance.pull_chunk()
 
-    assert np.array_equal(data_inlet_instance.buffers[0], sample_data)
-    assert data_inlet_instance.ptr == 1
+    assert samples.shape == (0, data_inlet_instance.channel_count)
 
 
-def test_pull_sample_stream_lost(
+def test_pull_chunk_stream_lost(
     data_inlet_instance: data_inlet.DataInlet,
     mock_stream_inlet: Tuple[MagicMock, List[float]],
 ) -> None:
-    """Tests pulling a sample from the LSL stream when the stream is lost.
+    """Tests pulling a chunk from the LSL stream when the stream is lost.
 
     Ensures that a StreamLostError is raised if the LSL stream is lost during
-    sample pulling.
+    chunk pulling.
 
     Args:
         data_inlet_instance: Fixture providing the DataInlet instance.
         mock_stream_inlet: Fixture providing mock StreamInlet.
     """
     inlet, _ = mock_stream_inlet
-    inlet.pull_sample.side_effect = LostError
+    inlet.pull_chunk.side_effect = LostError
 
     with pytest.raises(
         exceptions.StreamLostError, match="Stream source has been lost."
     ):
-        data_inlet_instance.pull_sample()
+        data_inlet_instance.pull_chunk()
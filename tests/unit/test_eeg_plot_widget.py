@@ -2,6 +2,7 @@
 
 from typing import Dict
 
+import numpy as np
 import pytest
 from PyQt6 import QtWidgets
 
@@ -22,7 +23,6 @@ def test_data() -> Dict:
         "third_channel": "EEGStream:Pz",
         "sample_value": 1.23,
         "offset": config.Config.EEG_OFFSET,
-        "initial_buffer": [4.56] * config.Config.MAX_SAMPLES,
     }
 
 
@@ -57,12 +57,63 @@ def test_add_channel(
     expected_label = channel.split(":", 1)[-1]
 
     assert populated_widget._channel_order[channel] == 0
-    assert populated_widget._buffers[channel] == []
+    assert populated_widget._buffers[channel].capacity == config.Config.MAX_SAMPLES
+    assert len(populated_widget._buffers[channel]) == 0
     assert populated_widget._channel_visible[channel] is True
     assert channel in populated_widget._data_items
     assert populated_widget._text_items[channel].toPlainText() == expected_label
 
 
+def test_add_channel_short_name(
+    qt_app: QtWidgets.QApplication, test_data: Dict
+) -> None:
+    """Tests that a given short name is used as the channel label.
+
+    Args:
+        qt_app: The QApplication instance.
+        test_data: Dictionary containing test data values.
+    """
+    widget = eeg_plot_widget.EEGPlotWidget()
+
+    widget.add_channel(test_data["first_channel"], short_name="Frontal")
+
+    assert widget._text_items[test_data["first_channel"]].toPlainText() == "Frontal"
+
+
+def test_add_channel_downsampling(
+    populated_widget: eeg_plot_widget.EEGPlotWidget, test_data: Dict
+) -> None:
+    """Tests that channels use automatic peak downsampling and clip to the view.
+
+    Args:
+        populated_widget: An EEGPlotWidget with a channel already added.
+        test_data: Dictionary containing test data values.
+    """
+    data_item = populated_widget._data_items[test_data["first_channel"]]
+
+    assert data_item.opts["autoDownsample"] is True
+    assert data_item.opts["downsampleMethod"] == "peak"
+    assert data_item.opts["clipToView"] is True
+
+
+def test_declare_channels(
+    populated_widget: eeg_plot_widget.EEGPlotWidget, test_data: Dict
+) -> None:
+    """Tests declaring several channels at once, skipping existing ones.
+
+    Args:
+        populated_widget: An EEGPlotWidget with a channel already added.
+        test_data: Dictionary containing test data values.
+    """
+    channels = [test_data["first_channel"], test_data["second_channel"]]
+
+    populated_widget.declare_channels(channels, short_names=["F", "C"])
+
+    assert list(populated_widget._channel_order) == channels
+    assert populated_widget._channel_order[test_data["second_channel"]] == 1
+    assert populated_widget._text_items[channels[1]].toPlainText() == "C"
+
+
 def test_add_duplicate_channel(
     populated_widget: eeg_plot_widget.EEGPlotWidget, test_data: Dict
 ) -> None:
@@ -95,8 +146,9 @@ def test_update_data(
 
     populated_widget.update_data(channel, sample, visibility)
 
-    assert len(populated_widget._buffers[channel]) == 1
-    assert populated_widget._buffers[channel][0] == sample
+    assert np.array_equal(
+        populated_widget._buffers[channel].window(), [np.float32(sample)]
+    )
     assert populated_widget._channel_visible[channel] is visibility
     assert populated_widget._data_items[channel].isVisible() is visibility
     assert populated_widget._text_items[channel].isVisible() is visibility
@@ -112,14 +164,163 @@ def test_update_data_overflow(
         test_data: Dictionary containing test data values.
     """
     channel = test_data["first_channel"]
-    populated_widget._buffers[channel] = test_data["initial_buffer"].copy()
+    initial_buffer = np.arange(config.Config.MAX_SAMPLES, dtype=float)
+    for value in initial_buffer:
+        populated_widget.update_data(channel, value, True)
     overflow_sample = test_data["sample_value"]
 
     populated_widget.update_data(channel, overflow_sample, True)
+    window = populated_widget._buffers[channel].window()
+
+    assert len(window) == config.Config.MAX_SAMPLES
+    assert window[-1] == overflow_sample
+    assert window[0] == initial_buffer[1]
+    assert np.array_equal(window[:-1], initial_buffer[1:])
+
+
+def test_update_data_defers_redraw(
+    populated_widget: eeg_plot_widget.EEGPlotWidget, test_data: Dict
+) -> None:
+    """Tests that samples are only drawn when the widget is flushed.
+
+    Args:
+        populated_widget: An EEGPlotWidget with a channel already added.
+        test_data: Dictionary containing test data values.
+    """
+    channel = test_data["first_channel"]
+    data_item = populated_widget._data_items[channel]
+
+    populated_widget.update_data(channel, test_data["sample_value"], True)
+    populated_widget.update_data(channel, test_data["sample_value"], True)
+    x_before, _ = data_item.getData()
+    populated_widget.flush()
+    x_after, _ = data_item.getData()
+
+    assert x_before is None or len(x_before) == 0
+    assert len(x_after) == 2
+    assert populated_widget._dirty == set()
+
+
+def test_update_data_hidden_channel_not_redrawn(
+    populated_widget: eeg_plot_widget.EEGPlotWidget, test_data: Dict
+) -> None:
+    """Tests that hidden channels keep buffering without being redrawn.
+
+    Args:
+        populated_widget: An EEGPlotWidget with a channel already added.
+        test_data: Dictionary containing test data values.
+    """
+    channel = test_data["first_channel"]
+    data_item = populated_widget._data_items[channel]
+
+    populated_widget.update_data(channel, test_data["sample_value"], False)
+    populated_widget.flush()
+    x_hidden, _ = data_item.getData()
+    populated_widget.update_data(channel, test_data["sample_value"], True)
+    populated_widget.flush()
+    x_shown, _ = data_item.getData()
+
+    assert x_hidden is None or len(x_hidden) == 0
+    assert len(x_shown) == 2
+
+
+def test_update_block(qt_app: QtWidgets.QApplication, test_data: Dict) -> None:
+    """Tests writing a block of samples that wraps around the ring buffers.
+
+    Args:
+        qt_app: The QApplication instance.
+        test_data: Dictionary containing test data values.
+    """
+    widget = eeg_plot_widget.EEGPlotWidget()
+    channels = [test_data["first_channel"], test_data["second_channel"]]
+    n_samples = config.Config.MAX_SAMPLES + 10
+    block = np.arange(2 * n_samples, dtype=np.float32).reshape(n_samples, 2)
+    widget.update_block(channels, block[:20], [True, False])
+
+    widget.update_block(channels, block[20:], [True, False])
+
+    assert np.array_equal(
+        widget._buffers[channels[0]].window(), block[-config.Config.MAX_SAMPLES :, 0]
+    )
+    assert np.array_equal(
+        widget._buffers[channels[1]].window(), block[-config.Config.MAX_SAMPLES :, 1]
+    )
+    assert widget._channel_visible[channels[1]] is False
+    assert widget._dirty == {channels[0]}
+
+
+def test_update_data_writes_preallocated_output(
+    qt_app: QtWidgets.QApplication, test_data: Dict
+) -> None:
+    """Tests that samples are plotted from the channel's output array, unshifted.
+
+    The vertical offset is applied by positioning the plot line, not the data.
+
+    Args:
+        qt_app: The QApplication instance.
+        test_data: Dictionary containing test data values.
+    """
+    widget = eeg_plot_widget.EEGPlotWidget()
+    widget.add_channel(test_data["first_channel"])
+    widget.add_channel(test_data["second_channel"])
+    y_out = widget._buffers[test_data["second_channel"]]._out
+    data_item = widget._data_items[test_data["second_channel"]]
+
+    widget.update_data(test_data["second_channel"], test_data["sample_value"], True)
+    widget.flush()
+    _, y_data = data_item.getData()
+
+    assert y_out.dtype == np.float32
+    assert y_data[0] == pytest.approx(test_data["sample_value"], rel=1e-6)
+    assert np.shares_memory(y_data, y_out)
+    assert data_item.pos().y() == test_data["offset"]
+
+
+def test_hiding_channel_moves_plot_lines(
+    qt_app: QtWidgets.QApplication, test_data: Dict
+) -> None:
+    """Tests that hiding a channel shifts the following plot lines up.
+
+    Args:
+        qt_app: The QApplication instance.
+        test_data: Dictionary containing test data values.
+    """
+    widget = eeg_plot_widget.EEGPlotWidget()
+    widget.add_channel(test_data["first_channel"])
+    widget.add_channel(test_data["second_channel"])
+    widget.add_channel(test_data["third_channel"])
+    third_item = widget._data_items[test_data["third_channel"]]
+
+    widget.update_data(test_data["first_channel"], test_data["sample_value"], False)
+    hidden_y = third_item.pos().y()
+    widget.update_data(test_data["first_channel"], test_data["sample_value"], True)
+
+    assert hidden_y == test_data["offset"]
+    assert third_item.pos().y() == 2 * test_data["offset"]
+    assert widget._text_items[test_data["third_channel"]].pos().y() == (
+        2 * test_data["offset"]
+    )
+
+
+def test_update_data_shares_x_axis(
+    qt_app: QtWidgets.QApplication, test_data: Dict
+) -> None:
+    """Tests that every channel plots against the shared x-axis array.
+
+    Args:
+        qt_app: The QApplication instance.
+        test_data: Dictionary containing test data values.
+    """
+    widget = eeg_plot_widget.EEGPlotWidget()
+
+    widget.update_data(test_data["first_channel"], test_data["sample_value"], True)
+    widget.update_data(test_data["second_channel"], test_data["sample_value"], True)
+    widget.flush()
+    x_first, _ = widget._data_items[test_data["first_channel"]].getData()
+    x_second, _ = widget._data_items[test_data["second_channel"]].getData()
 
-    assert len(populated_widget._buffers[channel]) == config.Config.MAX_SAMPLES
-    assert populated_widget._buffers[channel][-1] == overflow_sample
-    assert populated_widget._buffers[channel][0] == test_data["initial_buffer"][1]
+    assert np.shares_memory(x_first, widget._x_data)
+    assert np.shares_memory(x_second, widget._x_data)
 
 
 def test_auto_channel_creation(qt_app: QtWidgets.QApplication, test_data: Dict) -> None:
@@ -135,7 +336,10 @@ def test_auto_channel_creation(qt_app: QtWidgets.QApplication, test_data: Dict)
 
     assert test_data["first_channel"] in widget._channel_order
     assert test_data["first_channel"] in widget._buffers
-    assert widget._buffers[test_data["first_channel"]] == [test_data["sample_value"]]
+    assert np.array_equal(
+        widget._buffers[test_data["first_channel"]].window(),
+        [np.float32(test_data["sample_value"])],
+    )
 
 
 def test_showing_hidden_channel_restores_order(
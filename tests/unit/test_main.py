@@ -0,0 +1,112 @@
+"""Unit tests for the main entry point of the MoBI_View package."""
+
+import sys
+import time
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from PyQt6 import QtCore
+from pytest_mock import MockFixture
+
+import MoBI_View.main
+
+
+class MockDataInlet(QtCore.QObject):
+    """Mock DataInlet that records the thread it was constructed on."""
+
+    def __init__(self, info: MagicMock) -> None:
+        """Initializes the mock inlet from a mocked StreamInfo.
+
+        The first stream is opened slowest so that the inlets finish out of
+        discovery order, and a stream named "Broken" fails to open.
+
+        Args:
+            info: A mocked partial StreamInfo.
+
+        Raises:
+            RuntimeError: If the stream is named "Broken".
+        """
+        super().__init__()
+        if info.name() == "Broken":
+            raise RuntimeError("Unable to open stream.")
+        if info.name() == "Stream1":
+            time.sleep(0.1)
+        self.stream_name: str = info.name()
+        self.stream_type: str = info.type()
+        self.built_on: QtCore.QThread | None = QtCore.QThread.currentThread()
+
+
+def _stream_info(name: str) -> MagicMock:
+    """Creates a mocked partial StreamInfo.
+
+    Args:
+        name: The name of the stream.
+
+    Returns:
+        A MagicMock whose name() and type() return the given name and "EEG".
+    """
+    info = MagicMock()
+    info.name.return_value = name
+    info.type.return_value = "EEG"
+    return info
+
+
+@pytest.fixture
+def created_inlets(
+    mocker: MockFixture, monkeypatch: pytest.MonkeyPatch
+) -> List[MockDataInlet]:
+    """Runs main() with mocked streams and returns the inlets handed to the presenter.
+
+    Args:
+        mocker: A fixture for mocking.
+        monkeypatch: Fixture for patching objects.
+
+    Returns:
+        The data_inlets argument passed to MainAppPresenter.
+    """
+    streams = [_stream_info(name) for name in ("Stream1", "Broken", "Stream2")]
+    mocker.patch.object(MoBI_View.main, "resolve_streams", return_value=streams)
+    mocker.patch.object(MoBI_View.main, "DataInlet", MockDataInlet)
+    mocker.patch.object(MoBI_View.main, "QApplication")
+    mocker.patch.object(MoBI_View.main, "MainAppView")
+    presenter_cls = mocker.patch.object(MoBI_View.main, "MainAppPresenter")
+    monkeypatch.setattr(sys, "exit", lambda x: None)
+
+    MoBI_View.main.main()
+
+    return presenter_cls.call_args.kwargs["data_inlets"]
+
+
+def test_main_keeps_discovery_order(created_inlets: List[MockDataInlet]) -> None:
+    """Tests that inlets are returned in discovery order, not completion order.
+
+    Args:
+        created_inlets: The inlets handed to the presenter.
+    """
+    assert [inlet.stream_name for inlet in created_inlets] == ["Stream1", "Stream2"]
+
+
+def test_main_skips_failed_inlet(created_inlets: List[MockDataInlet]) -> None:
+    """Tests that a stream whose inlet cannot be constructed is skipped.
+
+    Args:
+        created_inlets: The inlets handed to the presenter.
+    """
+    assert len(created_inlets) == 2
+    assert "Broken" not in [inlet.stream_name for inlet in created_inlets]
+
+
+def test_main_moves_inlets_to_main_thread(
+    created_inlets: List[MockDataInlet],
+) -> None:
+    """Tests that inlets built on worker threads are moved to the main thread.
+
+    Args:
+        created_inlets: The inlets handed to the presenter.
+    """
+    main_thread = QtCore.QThread.currentThread()
+
+    for inlet in created_inlets:
+        assert inlet.built_on != main_thread
+        assert inlet.thread() == main_thread
@@ -23,9 +23,8 @@ def mock_data_inlet(mocker: MockFixture) -> MagicMock:
     """Creates the first mock instance of DataInlet."""
     inlet_mock = mocker.MagicMock(spec=data_inlet.DataInlet)
     inlet_mock.stream_name = "Stream1"
-    inlet_mock.channel_info = {"labels": ["Channel1", "Channel2"]}
-    inlet_mock.buffers = np.array([[0.1, 0.2], [0.3, 0.4]])
-    inlet_mock.ptr = 2
+    inlet_mock.channel_labels = ("Channel1", "Channel2")
+    inlet_mock.pull_chunk.return_value = np.array([[0.1, 0.2], [0.3, 0.4]])
     return inlet_mock
 
 
@@ -85,16 +84,18 @@ def test_poll_data_success(
         mock_view: A mocked instance of IMainAppView.
         mock_data_inlet: A mocked instance of DataInlet.
     """
-    expected_plot_data = {
-        "stream_name": "Stream1",
-        "data": [0.3, 0.4],
-        "channel_labels": ["Channel1", "Channel2"],
-    }
+    expected_data = [[0.1, 0.2], [0.3, 0.4]]
+    expected_labels = ("Channel1", "Channel2")
 
     presenter.poll_data()
+    (plot_data,), _ = mock_view.update_plot.call_args
 
-    mock_data_inlet.pull_sample.assert_called_once()
-    mock_view.update_plot.assert_called_once_with(expected_plot_data)
+    mock_data_inlet.pull_chunk.assert_called_once()
+    mock_view.update_plot.assert_called_once()
+    mock_view.flush.assert_called_once()
+    assert plot_data["stream_name"] == "Stream1"
+    assert np.array_equal(plot_data["data"], expected_data)
+    assert plot_data["channel_labels"] == expected_labels
 
 
 def test_poll_data_no_samples(
@@ -102,18 +103,18 @@ def test_poll_data_no_samples(
     mock_view: MagicMock,
     mock_data_inlet: MagicMock,
 ) -> None:
-    """Tests poll_data when no samples have been pulled yet.
+    """Tests poll_data when the DataInlet has no new samples.
 
     Args:
         presenter: An instance of MainAppPresenter.
         mock_view: A mocked instance of IMainAppView.
         mock_data_inlet: A mocked instance of DataInlet.
     """
-    mock_data_inlet.ptr = 0
+    mock_data_inlet.pull_chunk.return_value = np.empty((0, 2))
 
     presenter.poll_data()
 
-    mock_data_inlet.pull_sample.assert_called_once()
+    mock_data_inlet.pull_chunk.assert_called_once()
     mock_view.update_plot.assert_not_called()
 
 
@@ -129,13 +130,11 @@ def test_poll_data_stream_lost(
         mock_view: A mocked instance of IMainAppView.
         mock_data_inlet: A mocked instance of DataInlet.
     """
-    mock_data_inlet.pull_sample.side_effect = exceptions.StreamLostError(
-        "Stream1 lost."
-    )
+    mock_data_inlet.pull_chunk.side_effect = exceptions.StreamLostError("Stream1 lost.")
 
     presenter.poll_data()
 
-    mock_data_inlet.pull_sample.assert_called_once()
+    mock_data_inlet.pull_chunk.assert_called_once()
     mock_view.display_error.assert_called_once_with("Stream1 lost.")
 
 
@@ -151,13 +150,13 @@ def test_poll_data_invalid_channel_count(
         mock_view: A mocked instance of IMainAppView.
         mock_data_inlet: A mocked instance of DataInlet.
     """
-    mock_data_inlet.pull_sample.side_effect = exceptions.InvalidChannelCountError(
+    mock_data_inlet.pull_chunk.side_effect = exceptions.InvalidChannelCountError(
         "Invalid channel count in Stream1."
     )
 
     presenter.poll_data()
 
-    mock_data_inlet.pull_sample.assert_called_once()
+    mock_data_inlet.pull_chunk.assert_called_once()
     mock_view.display_error.assert_called_once_with("Invalid channel count in Stream1.")
 
 
@@ -173,13 +172,13 @@ def test_poll_data_invalid_channel_format(
         mock_view: A mocked instance of IMainAppView.
         mock_data_inlet: A mocked instance of DataInlet.
     """
-    mock_data_inlet.pull_sample.side_effect = exceptions.InvalidChannelFormatError(
+    mock_data_inlet.pull_chunk.side_effect = exceptions.InvalidChannelFormatError(
         "Invalid channel format in Stream1."
     )
 
     presenter.poll_data()
 
-    mock_data_inlet.pull_sample.assert_called_once()
+    mock_data_inlet.pull_chunk.assert_called_once()
     mock_view.display_error.assert_called_once_with(
         "Invalid channel format in Stream1."
     )
@@ -197,11 +196,11 @@ def test_poll_data_unexpected_exception(
         mock_view: A mocked instance of IMainAppView.
         mock_data_inlet: A mocked instance of DataInlet.
     """
-    mock_data_inlet.pull_sample.side_effect = Exception("Unexpected error in Stream1.")
+    mock_data_inlet.pull_chunk.side_effect = Exception("Unexpected error in Stream1.")
 
     presenter.poll_data()
 
-    mock_data_inlet.pull_sample.assert_called_once()
+    mock_data_inlet.pull_chunk.assert_called_once()
     mock_view.display_error.assert_called_once_with(
         "Unexpected error: Unexpected error in Stream1."
     )
@@ -238,15 +237,14 @@ def test_on_data_updated(
     stream_name = "Stream1"
     sample = np.array([0.5, 0.6])
     channel_labels = ["Channel1", "Channel2"]
-    expected_plot_data = {
-        "stream_name": stream_name,
-        "data": sample.tolist(),
-        "channel_labels": channel_labels,
-    }
 
     presenter.on_data_updated(stream_name, sample, channel_labels)
+    (plot_data,), _ = mock_view.update_plot.call_args
 
-    mock_view.update_plot.assert_called_once_with(expected_plot_data)
+    mock_view.update_plot.assert_called_once()
+    assert plot_data["stream_name"] == stream_name
+    assert plot_data["data"] is sample
+    assert plot_data["channel_labels"] == channel_labels
 
 
 def test_on_data_updated_empty_sample(
@@ -261,12 +259,24 @@ def test_on_data_updated_empty_sample(
     stream_name = "Stream1"
     sample = np.array([])
     channel_labels: list[str] = []
-    expected_plot_data = {
-        "stream_name": stream_name,
-        "data": [],
-        "channel_labels": channel_labels,
-    }
 
     presenter.on_data_updated(stream_name, sample, channel_labels)
+    (plot_data,), _ = mock_view.update_plot.call_args
+
+    mock_view.update_plot.assert_called_once()
+    assert plot_data["stream_name"] == stream_name
+    assert plot_data["data"].size == 0
+    assert plot_data["channel_labels"] == channel_labels
+
 
-    mock_view.update_plot.assert_called_once_with(expected_plot_data)
+def test_presenter_uses_slots(
+    presenter: main_app_presenter.MainAppPresenter,
+) -> None:
+    """Tests that MainAppPresenter stores its attributes in slots.
+
+    Args:
+        presenter: An instance of MainAppPresenter.
+    """
+    assert not hasattr(presenter, "__dict__")
+    with pytest.raises(AttributeError):
+        presenter.unknown_attribute = True  # type: ignore[attr-defined]
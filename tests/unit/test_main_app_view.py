@@ -4,8 +4,10 @@ Tests cover initial state, updating plots for EEG and non-EEG streams, toggling
 channel visibility, error display, and tree item changes.
 """
 
-from typing import Dict, List, Tuple, cast
+from typing import Dict, List, Set, Tuple, cast
+from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from PyQt6 import QtCore, QtWidgets
 
@@ -92,7 +94,7 @@ def tree_setup(
 def test_initial_state(app_view: main_app_view.MainAppView, test_data: Dict) -> None:
     """Checks the initial setup of MainAppView.
 
-    Verifies window title, status bar message, empty visibility map, and
+    Verifies window title, status bar message, empty hidden-channel set, and
     stream registration upon initialization.
 
     Args:
@@ -101,22 +103,52 @@ def test_initial_state(app_view: main_app_view.MainAppView, test_data: Dict) ->
     """
     expected_title = test_data["window_title"]
     expected_status = test_data["status_ok"]
-    expected_visibility: Dict[str, bool] = {}
-    expected_stream_types = sorted([test_data["eeg_stream"], test_data["gaze_stream"]])
+    expected_hidden: Set[str] = set()
     expected_tree_item_count = 0
 
     status_bar = app_view.statusBar()
     actual_status = (
         cast(QtWidgets.QStatusBar, status_bar).currentMessage() if status_bar else ""
     )
-    actual_stream_types = sorted(list(app_view._stream_types.keys()))
     actual_tree_item_count = app_view._tree_widget.topLevelItemCount()
 
     assert app_view.windowTitle() == expected_title
     assert actual_status == expected_status
-    assert app_view._channel_visibility == expected_visibility
-    assert actual_stream_types == expected_stream_types
+    assert app_view._hidden_channels == expected_hidden
+    assert app_view._eeg_streams == {test_data["eeg_stream"]}
     assert actual_tree_item_count == expected_tree_item_count
+    assert app_view._tree_widget.uniformRowHeights() is True
+
+
+def test_add_tree_item_does_not_toggle_visibility(
+    app_view: main_app_view.MainAppView,
+    test_data: Dict,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Tests that building a channel item does not reach the visibility handler.
+
+    Args:
+        app_view: The MainAppView instance.
+        test_data: Dictionary containing test values.
+        monkeypatch: Fixture for patching objects.
+    """
+    calls: List[Tuple[str, bool]] = []
+    monkeypatch.setattr(
+        app_view,
+        "set_plot_channel_visibility",
+        lambda name, visible: calls.append((name, visible)),
+    )
+
+    app_view.add_tree_item(test_data["test_stream"], test_data["test_channel1"])
+    channel_item = app_view._channel_items[test_data["test_channel1"]]
+
+    assert calls == []
+    assert app_view._tree_widget.signalsBlocked() is False
+    assert channel_item.checkState(0) == QtCore.Qt.CheckState.Checked
+    assert (
+        channel_item.data(0, QtCore.Qt.ItemDataRole.UserRole)
+        == test_data["test_channel1"]
+    )
 
 
 @pytest.mark.parametrize(
@@ -152,7 +184,6 @@ def test_update_plot(
     """
     for channel_key in channel_keys:
         app_view.add_tree_item(test_data[stream_key], test_data[channel_key])
-        app_view._channel_visibility[test_data[channel_key]] = True
 
     data = {
         "stream_name": test_data[stream_key],
@@ -176,6 +207,133 @@ def test_update_plot(
     )
 
 
+def test_add_tree_item_declares_eeg_channels(
+    app_view: main_app_view.MainAppView, test_data: Dict
+) -> None:
+    """Tests that EEG channels get their plot items when their tree items are added.
+
+    Args:
+        app_view: The MainAppView instance.
+        test_data: Dictionary containing test values.
+    """
+    app_view.add_tree_item(test_data["eeg_stream"], test_data["eeg_channel1"])
+    app_view.add_tree_item(test_data["gaze_stream"], test_data["gaze_channel"])
+    eeg_tab = app_view._eeg_tab
+
+    assert list(eeg_tab._channel_order) == [test_data["eeg_channel1"]]
+    assert eeg_tab._text_items[test_data["eeg_channel1"]].toPlainText() == "ChanA"
+    assert len(eeg_tab._buffers[test_data["eeg_channel1"]]) == 0
+
+
+def test_flush_redraws_both_tabs(
+    app_view: main_app_view.MainAppView, test_data: Dict
+) -> None:
+    """Tests that flush draws the buffered EEG and numeric samples.
+
+    Args:
+        app_view: The MainAppView instance.
+        test_data: Dictionary containing test values.
+    """
+    app_view.update_plot(
+        {
+            "stream_name": test_data["eeg_stream"],
+            "data": np.array([test_data["eeg_values"]]),
+            "channel_labels": test_data["eeg_labels"],
+        }
+    )
+    app_view.update_plot(
+        {
+            "stream_name": test_data["gaze_stream"],
+            "data": np.array([test_data["gaze_values"]]),
+            "channel_labels": test_data["gaze_labels"],
+        }
+    )
+    eeg_item = app_view._eeg_tab._data_items[test_data["eeg_channel1"]]
+    gaze_plot = app_view._numeric_tab._stream_plots[test_data["gaze_stream"]]
+    gaze_item = gaze_plot._channel_data_items[test_data["gaze_channel"]]
+
+    app_view.flush()
+    _, eeg_y = eeg_item.getData()
+    _, gaze_y = gaze_item.getData()
+
+    assert eeg_y[0] == pytest.approx(test_data["eeg_values"][0])
+    assert gaze_y[0] == pytest.approx(test_data["gaze_values"][0])
+
+
+def test_update_plot_eeg_block(
+    app_view: main_app_view.MainAppView, test_data: Dict
+) -> None:
+    """Tests that a block of EEG samples is written to the EEG tab in one call.
+
+    Args:
+        app_view: The MainAppView instance.
+        test_data: Dictionary containing test values.
+    """
+    channels = [test_data["eeg_channel1"], test_data["eeg_channel2"]]
+    for channel in channels:
+        app_view.add_tree_item(test_data["eeg_stream"], channel)
+    block = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    data = {
+        "stream_name": test_data["eeg_stream"],
+        "data": block,
+        "channel_labels": test_data["eeg_labels"],
+    }
+
+    app_view.update_plot(data)
+    app_view.update_plot(data)
+
+    assert app_view._channel_names[test_data["eeg_stream"]] == channels
+    assert np.array_equal(
+        app_view._eeg_tab._buffers[channels[0]].window(), np.tile(block[:, 0], 2)
+    )
+    assert np.array_equal(
+        app_view._eeg_tab._buffers[channels[1]].window(), np.tile(block[:, 1], 2)
+    )
+
+
+@pytest.mark.parametrize("stream_key", ["eeg_stream", "gaze_stream"])
+def test_update_plot_never_replays_per_sample(
+    app_view: main_app_view.MainAppView,
+    test_data: Dict,
+    monkeypatch: pytest.MonkeyPatch,
+    stream_key: str,
+) -> None:
+    """Tests that a block reaches the plots in one write, not one per sample.
+
+    Args:
+        app_view: The MainAppView instance.
+        test_data: Dictionary containing test values.
+        monkeypatch: Fixture for patching objects.
+        stream_key: Key of the stream name in test_data.
+    """
+    eeg_tab = app_view._eeg_tab
+    numeric_tab = app_view._numeric_tab
+    per_sample = [
+        MagicMock(wraps=eeg_tab.update_data),
+        MagicMock(wraps=numeric_tab.update_numeric_containers),
+    ]
+    per_block = [
+        MagicMock(wraps=eeg_tab.update_block),
+        MagicMock(wraps=numeric_tab.update_numeric_block),
+    ]
+    monkeypatch.setattr(eeg_tab, "update_data", per_sample[0])
+    monkeypatch.setattr(numeric_tab, "update_numeric_containers", per_sample[1])
+    monkeypatch.setattr(eeg_tab, "update_block", per_block[0])
+    monkeypatch.setattr(numeric_tab, "update_numeric_block", per_block[1])
+    block = np.arange(20.0).reshape(10, 2)
+
+    app_view.update_plot(
+        {
+            "stream_name": test_data[stream_key],
+            "data": block,
+            "channel_labels": ["A", "B"],
+        }
+    )
+
+    assert all(mock.call_count == 0 for mock in per_sample)
+    assert sum(mock.call_count for mock in per_block) == 1
+
+
 def test_update_plot_empty_data(
     app_view: main_app_view.MainAppView, test_data: Dict
 ) -> None:
@@ -188,7 +346,6 @@ def test_update_plot_empty_data(
         test_data: Dictionary containing test values.
     """
     app_view.add_tree_item(test_data["eeg_stream"], test_data["eeg_channel1"])
-    app_view._channel_visibility[test_data["eeg_channel1"]] = True
 
     data = {
         "stream_name": test_data["eeg_stream"],
@@ -220,7 +377,6 @@ def test_update_plot_unknown_stream(
     }
 
     app_view.add_tree_item(test_data["unknown_stream"], unknown_channel)
-    app_view._channel_visibility[unknown_channel] = True
     app_view.update_plot(data)
 
     assert test_data["unknown_stream"] in app_view._stream_items
@@ -239,11 +395,13 @@ def test_set_plot_channel_visibility(
         test_data: Dictionary containing test values.
     """
     chan_name = test_data["eeg_channel1"]
-    app_view._channel_visibility[chan_name] = True
 
     app_view.set_plot_channel_visibility(chan_name, False)
+    hidden_after_hide = set(app_view._hidden_channels)
+    app_view.set_plot_channel_visibility(chan_name, True)
 
-    assert app_view._channel_visibility[chan_name] is False
+    assert hidden_after_hide == {chan_name}
+    assert app_view._hidden_channels == set()
 
 
 def test_display_error(
@@ -280,20 +438,60 @@ def test_on_tree_item_changed_top_level(
 ) -> None:
     """Tests toggling a top-level tree item.
 
-    Verifies that when a parent stream item is toggled, all its child
-    channel items reflect the same checked state.
+    Verifies that when a parent stream item is toggled, Qt propagates the
+    checked state to all its child channel items and their visibility follows.
 
     Args:
         app_view: The MainAppView instance.
         tree_setup: Tuple with (app_view, parent, child1, child2) items.
     """
     stream_item, child1, child2 = tree_setup
+    user_role = QtCore.Qt.ItemDataRole.UserRole
 
     stream_item.setCheckState(0, QtCore.Qt.CheckState.Unchecked)
-    app_view._on_tree_item_changed(stream_item)
 
     assert child1.checkState(0) == QtCore.Qt.CheckState.Unchecked
     assert child2.checkState(0) == QtCore.Qt.CheckState.Unchecked
+    assert child1.data(0, user_role) in app_view._hidden_channels
+    assert child2.data(0, user_role) in app_view._hidden_channels
+
+
+def test_stream_toggle_is_handled_once(
+    app_view: main_app_view.MainAppView, tree_setup: Tuple
+) -> None:
+    """Tests that toggling a stream emits itemChanged once, for the stream item.
+
+    Args:
+        app_view: The MainAppView instance.
+        tree_setup: Tuple with (app_view, parent, child1, child2) items.
+    """
+    stream_item, _, _ = tree_setup
+    changed: List[QtWidgets.QTreeWidgetItem] = []
+    app_view._tree_widget.itemChanged.connect(changed.append)
+
+    stream_item.setCheckState(0, QtCore.Qt.CheckState.Unchecked)
+
+    assert changed == [stream_item]
+    assert app_view._tree_widget.signalsBlocked() is False
+    assert app_view._tree_widget.updatesEnabled() is True
+
+
+def test_on_tree_item_changed_partial_stream(
+    app_view: main_app_view.MainAppView, tree_setup: Tuple, test_data: Dict
+) -> None:
+    """Tests that hiding one channel leaves its stream partially checked.
+
+    Args:
+        app_view: The MainAppView instance.
+        tree_setup: Tuple with (app_view, parent, child1, child2) items.
+        test_data: Dictionary containing test values.
+    """
+    stream_item, child1, _ = tree_setup
+
+    child1.setCheckState(0, QtCore.Qt.CheckState.Unchecked)
+
+    assert stream_item.checkState(0) == QtCore.Qt.CheckState.PartiallyChecked
+    assert app_view._hidden_channels == {test_data["test_channel1"]}
 
 
 def test_on_tree_item_changed_child(
@@ -301,8 +499,8 @@ def test_on_tree_item_changed_child(
 ) -> None:
     """Tests toggling a child tree item.
 
-    Verifies that toggling a channel item updates the internal visibility
-    tracking dictionary to match the UI state.
+    Verifies that toggling a channel item updates the internal
+    hidden-channel set to match the UI state.
 
     Args:
         app_view: The MainAppView instance.
@@ -314,4 +512,4 @@ def test_on_tree_item_changed_child(
     child1.setCheckState(0, QtCore.Qt.CheckState.Unchecked)
     app_view._on_tree_item_changed(child1)
 
-    assert app_view._channel_visibility[test_data["test_channel1"]] is False
+    assert test_data["test_channel1"] in app_view._hidden_channels
@@ -6,6 +6,8 @@ handling for SingleStreamNumericPlotWidget and MultiStreamNumericContainer.
 
 from typing import Dict
 
+import numpy as np
+import pyqtgraph as pg
 import pytest
 from PyQt6 import QtWidgets
 
@@ -27,7 +29,6 @@ def test_data() -> Dict:
         "visible_sample": 1.23,
         "overflow_sample": 4.56,
         "hidden_sample": 7.89,
-        "initial_buffer": [0.12] * config.Config.MAX_SAMPLES,
     }
 
 
@@ -65,6 +66,58 @@ def populated_widget(
     return single_widget
 
 
+def test_single_widget_downsampling(
+    populated_widget: numeric_plot_widget.SingleStreamNumericPlotWidget,
+    test_data: Dict,
+) -> None:
+    """Tests that channels use automatic peak downsampling and clip to the view.
+
+    Args:
+        populated_widget: A SingleStreamNumericPlotWidget with a channel already added.
+        test_data: Dictionary containing test data values.
+    """
+    data_item = populated_widget._channel_data_items[test_data["first_channel"]]
+
+    assert data_item.opts["autoDownsample"] is True
+    assert data_item.opts["downsampleMethod"] == "peak"
+    assert data_item.opts["clipToView"] is True
+
+
+@pytest.mark.parametrize("index", [0, 5, 20, 21, 44])
+def test_define_channel_color(
+    single_widget: numeric_plot_widget.SingleStreamNumericPlotWidget,
+    index: int,
+) -> None:
+    """Tests that cached channel colors match pyqtgraph's indexed colors.
+
+    Args:
+        single_widget: A base SingleStreamNumericPlotWidget instance.
+        index: The channel index to look up.
+    """
+    expected = tuple(pg.intColor(index, values=3, hues=7).getRgb()[:3])
+
+    assert single_widget.define_channel_color(index) == expected
+
+
+def test_add_channel_uses_channel_color(
+    single_widget: numeric_plot_widget.SingleStreamNumericPlotWidget,
+    test_data: Dict,
+) -> None:
+    """Tests that channels are drawn with the color defined for their index.
+
+    Args:
+        single_widget: A base SingleStreamNumericPlotWidget instance.
+        test_data: Dictionary containing test data values.
+    """
+    single_widget.add_channel(test_data["first_channel"])
+    single_widget.add_channel(test_data["second_channel"])
+
+    second_item = single_widget._channel_data_items[test_data["second_channel"]]
+    pen_color = second_item.opts["pen"].color().getRgb()[:3]
+
+    assert pen_color == single_widget.define_channel_color(1)
+
+
 def test_single_widget_add_channel(
     populated_widget: numeric_plot_widget.SingleStreamNumericPlotWidget,
     test_data: Dict,
@@ -79,7 +132,9 @@ def test_single_widget_add_channel(
 
     assert channel in populated_widget._channel_data_items
     assert channel in populated_widget._buffers
-    assert populated_widget._buffers[channel] == []
+    assert populated_widget._buffers[channel].capacity == config.Config.MAX_SAMPLES
+    assert populated_widget._buffers[channel].window().dtype == np.float64
+    assert len(populated_widget._buffers[channel]) == 0
 
 
 @pytest.mark.parametrize("visible", [True, False])
@@ -100,8 +155,7 @@ def test_update_data(
 
     populated_widget.update_data(channel, sample, visible)
 
-    assert len(populated_widget._buffers[channel]) == 1
-    assert populated_widget._buffers[channel][0] == sample
+    assert np.array_equal(populated_widget._buffers[channel].window(), [sample])
     assert populated_widget._channel_data_items[channel].isVisible() is visible
 
 
@@ -116,12 +170,94 @@ def test_update_data_overflow(
         test_data: Dictionary containing test data values.
     """
     channel = test_data["first_channel"]
-    populated_widget._buffers[channel] = test_data["initial_buffer"]
+    initial_buffer = np.arange(config.Config.MAX_SAMPLES, dtype=np.float32)
+    for value in initial_buffer:
+        populated_widget.update_data(channel, value, True)
     populated_widget.update_data(channel, test_data["overflow_sample"], True)
+    window = populated_widget._buffers[channel].window()
 
-    assert len(populated_widget._buffers[channel]) == config.Config.MAX_SAMPLES
-    assert populated_widget._buffers[channel][-1] == test_data["overflow_sample"]
-    assert populated_widget._buffers[channel][0] == test_data["initial_buffer"][1]
+    assert len(window) == config.Config.MAX_SAMPLES
+    assert window[-1] == test_data["overflow_sample"]
+    assert np.array_equal(window[:-1], initial_buffer[1:])
+
+
+@pytest.mark.parametrize(
+    "value,dtype",
+    [(2**25 + 1, np.int32), (1e9 + 0.25, np.float64)],
+    ids=["int32", "double64"],
+)
+def test_update_block_keeps_precision(
+    single_widget: numeric_plot_widget.SingleStreamNumericPlotWidget,
+    test_data: Dict,
+    value: float,
+    dtype: type,
+) -> None:
+    """Tests that integer and double samples are buffered without rounding.
+
+    Args:
+        single_widget: A base SingleStreamNumericPlotWidget instance.
+        test_data: Dictionary containing test data values.
+        value: A sample value that float32 cannot represent exactly.
+        dtype: The native data type of the stream.
+    """
+    channel = test_data["first_channel"]
+
+    single_widget.update_block([channel], np.array([[value]], dtype=dtype), [True])
+
+    assert single_widget._buffers[channel].window()[0] == value
+
+
+def test_update_data_defers_redraw(
+    populated_widget: numeric_plot_widget.SingleStreamNumericPlotWidget,
+    test_data: Dict,
+) -> None:
+    """Tests that samples are only drawn when the widget is flushed.
+
+    Args:
+        populated_widget: A SingleStreamNumericPlotWidget with a channel already added.
+        test_data: Dictionary containing test data values.
+    """
+    channel = test_data["first_channel"]
+    data_item = populated_widget._channel_data_items[channel]
+
+    populated_widget.update_data(channel, test_data["visible_sample"], True)
+    x_before, _ = data_item.getData()
+    populated_widget.flush()
+    _, y_after = data_item.getData()
+
+    assert x_before is None or len(x_before) == 0
+    assert y_after[0] == test_data["visible_sample"]
+    assert np.shares_memory(y_after, populated_widget._buffers[channel]._out)
+    assert populated_widget._dirty == set()
+
+
+def test_update_block(
+    single_widget: numeric_plot_widget.SingleStreamNumericPlotWidget,
+    test_data: Dict,
+) -> None:
+    """Tests writing a block of samples that wraps around the ring buffers.
+
+    Args:
+        single_widget: A base SingleStreamNumericPlotWidget instance.
+        test_data: Dictionary containing test data values.
+    """
+    channels = [test_data["first_channel"], test_data["second_channel"]]
+    n_samples = config.Config.MAX_SAMPLES + 10
+    block = np.arange(2 * n_samples, dtype=np.float32).reshape(n_samples, 2)
+    single_widget.update_block(channels, block[:20], [True, False])
+
+    single_widget.update_block(channels, block[20:], [True, False])
+
+    assert np.array_equal(
+        single_widget._buffers[channels[0]].window(),
+        block[-config.Config.MAX_SAMPLES :, 0],
+    )
+    assert np.array_equal(
+        single_widget._buffers[channels[1]].window(),
+        block[-config.Config.MAX_SAMPLES :, 1],
+    )
+    assert single_widget._channel_data_items[channels[1]].isVisible() is False
+    assert single_widget._dirty == {channels[0]}
 
 
 def test_add_duplicate_channel(
@@ -159,7 +295,10 @@ def test_auto_channel_creation(
 
     assert channel in single_widget._channel_data_items
     assert channel in single_widget._buffers
-    assert single_widget._buffers[channel] == [test_data["visible_sample"]]
+    assert np.array_equal(
+        single_widget._buffers[channel].window(),
+        [test_data["visible_sample"]],
+    )
 
 
 @pytest.mark.parametrize("visibility", [True, False])
@@ -234,3 +373,24 @@ def test_container_updates_existing_channels(
         container._stream_plots[stream]._channel_data_items[second_channel].isVisible()
         is False
     )
+
+
+def test_container_update_numeric_block(
+    qt_app: QtWidgets.QApplication, test_data: Dict
+) -> None:
+    """Tests that MultiStreamNumericContainer routes blocks to the stream widget.
+
+    Args:
+        qt_app: The QApplication instance for the test.
+        test_data: Dictionary containing test data values.
+    """
+    container = numeric_plot_widget.MultiStreamNumericContainer()
+    stream = test_data["stream_name"]
+    channels = [test_data["first_channel"], test_data["second_channel"]]
+    block = np.array([[1.0, 2.0], [3.0, 4.0]])
+
+    container.update_numeric_block(stream, channels, block, [True, True])
+
+    stream_plot = container._stream_plots[stream]
+    assert np.array_equal(stream_plot._buffers[channels[0]].window(), block[:, 0])
+    assert np.array_equal(stream_plot._buffers[channels[1]].window(), block[:, 1])
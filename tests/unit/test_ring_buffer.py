@@ -0,0 +1,91 @@
+"""Unit tests for the RingBuffer class in the MoBI_View package."""
+
+import numpy as np
+import pytest
+
+from MoBI_View.core import ring_buffer
+
+
+@pytest.fixture
+def buffer() -> ring_buffer.RingBuffer:
+    """Creates an empty RingBuffer holding up to four samples."""
+    return ring_buffer.RingBuffer(4)
+
+
+def test_ring_buffer_initialization(buffer: ring_buffer.RingBuffer) -> None:
+    """Tests that a new RingBuffer is empty and float32 by default.
+
+    Args:
+        buffer: An empty RingBuffer.
+    """
+    assert buffer.capacity == 4
+    assert len(buffer) == 0
+    assert buffer.window().size == 0
+    assert buffer.window().dtype == np.float32
+
+
+def test_ring_buffer_write_keeps_order(buffer: ring_buffer.RingBuffer) -> None:
+    """Tests that written samples are returned oldest first.
+
+    Args:
+        buffer: An empty RingBuffer.
+    """
+    buffer.write(np.array([1.0, 2.0]))
+    buffer.write(np.array([3.0]))
+
+    assert len(buffer) == 3
+    assert np.array_equal(buffer.window(), [1.0, 2.0, 3.0])
+
+
+def test_ring_buffer_write_wraps_around(buffer: ring_buffer.RingBuffer) -> None:
+    """Tests that writes past the capacity drop the oldest samples.
+
+    Args:
+        buffer: An empty RingBuffer.
+    """
+    buffer.write(np.array([1.0, 2.0, 3.0]))
+    buffer.write(np.array([4.0, 5.0, 6.0]))
+
+    assert len(buffer) == 4
+    assert np.array_equal(buffer.window(), [3.0, 4.0, 5.0, 6.0])
+
+
+def test_ring_buffer_write_larger_than_capacity(
+    buffer: ring_buffer.RingBuffer,
+) -> None:
+    """Tests that a block larger than the capacity keeps its most recent samples.
+
+    Args:
+        buffer: An empty RingBuffer.
+    """
+    buffer.write(np.arange(10, dtype=np.float32))
+
+    assert np.array_equal(buffer.window(), [6.0, 7.0, 8.0, 9.0])
+
+
+def test_ring_buffer_snapshot(buffer: ring_buffer.RingBuffer) -> None:
+    """Tests that a snapshot is copied into the reused output array.
+
+    Args:
+        buffer: An empty RingBuffer.
+    """
+    buffer.write(np.array([1.0, 2.0]))
+
+    snapshot = buffer.snapshot()
+    buffer.write(np.array([3.0, 4.0, 5.0]))
+
+    assert np.array_equal(snapshot, [1.0, 2.0])
+    assert np.shares_memory(snapshot, buffer._out)
+    assert not np.shares_memory(snapshot, buffer.window())
+    assert np.shares_memory(buffer.snapshot(), snapshot)
+
+
+def test_ring_buffer_dtype() -> None:
+    """Tests that a RingBuffer stores samples in the requested data type."""
+    buffer = ring_buffer.RingBuffer(4, dtype=np.float64)
+
+    buffer.write(np.array([2**25 + 1], dtype=np.int32))
+
+    assert buffer.dtype == np.float64
+    assert buffer.snapshot().dtype == np.float64
+    assert buffer.window()[0] == 2**25 + 1